@@ -2,6 +2,7 @@ import logging
 import os
 import re
 import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import aiofiles
@@ -11,20 +12,26 @@ import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-# Add src directory to path for new imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src directory to path for new imports (done once, here only)
+src_path = str(Path(__file__).parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 from src.bot.cogs.automation import AutomationCog
 from src.bot.cogs.profile import ProfileCog
 from src.bot.cogs.reporting import ReportingCog
 from src.bot.cogs.volunteer import VolunteerCog
+from src.database.pool import SQLiteConnectionPool, configure_connection
+from src.database.write_queue import WriteQueue
 from src.utils.github import fetch_django_pr_summary, get_django_welcome_message
+from ui import invalidate_available_dates
 
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 DATABASE = os.getenv("DATABASE")
 
+_MARKDOWN_LINK_RE = re.compile(r"\[(.*?)\]\((https?://.*?)\)")
+
 
 class VolunteerBot(commands.Bot):
     def __init__(self):
@@ -32,21 +39,25 @@ class VolunteerBot(commands.Bot):
         intents.message_content = True
         super().__init__(command_prefix="!", intents=intents)
         self.cursor = None
+        self.pool = None
+        self.write_queue = None
         self.django_welcome_phrases = None
         self.db_path = os.path.join(os.path.dirname(__file__), DATABASE)
 
     async def generate_pr_summary(self):
         """Generate weekly PR summary and store in database"""
-        # Get last week's date range using Arrow's span feature
-        last_week = arrow.utcnow().shift(weeks=-1)
-        last_monday, last_sunday = last_week.span("week")
+        # Get last week's Monday-to-Sunday date range
+        today = datetime.now(timezone.utc).date()
+        last_monday = today - timedelta(days=today.weekday() + 7)
+        last_sunday = last_monday + timedelta(days=6)
 
         # Format dates for API calls
-        start_date = last_monday.format("YYYY-MM-DD")
-        end_date = last_sunday.format("YYYY-MM-DD")
+        start_date = last_monday.isoformat()
+        end_date = last_sunday.isoformat()
 
         # Check if we already have this week's report
         async with aiosqlite.connect(self.db_path) as conn:
+            await configure_connection(conn)
             async with conn.execute(
                 "SELECT id FROM weekly_reports WHERE start_date = ? AND end_date = ?",
                 (start_date, end_date),
@@ -69,7 +80,7 @@ class VolunteerBot(commands.Bot):
         [text](<https://example.com>)
         which disables Discord's link preview.
         """
-        return re.sub(r"\[(.*?)\]\((https?://.*?)\)", r"[\1](<\2>)", text)
+        return _MARKDOWN_LINK_RE.sub(r"[\1](<\2>)", text)
 
     async def _check_database_setup(self):
         """Check if database exists and is properly set up"""
@@ -84,6 +95,7 @@ class VolunteerBot(commands.Bot):
 
         # Check if migrations are needed for existing database
         async with aiosqlite.connect(self.db_path) as conn:
+            await configure_connection(conn)
             # Check if applied_migrations table exists (indicates migration system is in use)
             async with conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='applied_migrations'"
@@ -146,6 +158,7 @@ class VolunteerBot(commands.Bot):
             return False
 
         async with aiosqlite.connect(self.db_path) as conn:
+            await configure_connection(conn)
             async with aiofiles.open(schema_path, "r") as f:
                 schema_content = await f.read()
             await conn.executescript(schema_content)
@@ -183,6 +196,7 @@ class VolunteerBot(commands.Bot):
     async def _setup_initial_volunteer_dates(self):
         """Set up initial volunteer dates if database is empty"""
         async with aiosqlite.connect(self.db_path) as conn:
+            await configure_connection(conn)
             # Check if we already have volunteer dates
             async with conn.execute("SELECT COUNT(*) FROM volunteers") as cursor:
                 count = (await cursor.fetchone())[0]
@@ -203,6 +217,7 @@ class VolunteerBot(commands.Bot):
                     )
                     current = current.shift(weeks=1)
                 await conn.commit()
+                invalidate_available_dates()
                 print("✅ Initial volunteer dates created")
 
     async def setup_hook(self):
@@ -217,6 +232,15 @@ class VolunteerBot(commands.Bot):
 
         # Connect to database early for setup operations
         self.cursor = await aiosqlite.connect(self.db_path)
+        await configure_connection(self.cursor)
+
+        # Pooled connections for command handlers
+        self.pool = SQLiteConnectionPool(self.db_path)
+        await self.pool.open()
+
+        # Coalesces interaction writes into shared transactions
+        self.write_queue = WriteQueue(self.db_path)
+        await self.write_queue.start()
 
         # Get and cache Django's welcome message using database
         welcome_phrases = await get_django_welcome_message(self.cursor)
@@ -232,13 +256,23 @@ class VolunteerBot(commands.Bot):
         await self._setup_initial_volunteer_dates()
 
         # Load cogs
-        await self.add_cog(VolunteerCog(self, self.cursor))
-        await self.add_cog(ProfileCog(self, self.cursor))
-        await self.add_cog(ReportingCog(self, self.cursor))
+        await self.add_cog(VolunteerCog(self, self.pool))
+        await self.add_cog(ProfileCog(self, self.pool))
+        await self.add_cog(ReportingCog(self, self.pool))
         await self.add_cog(AutomationCog(self, self.cursor))
 
         print("✅ Bot setup completed successfully!")
 
+    async def close(self):
+        """Close database connections on shutdown"""
+        await super().close()
+        if self.write_queue:
+            await self.write_queue.close()
+        if self.pool:
+            await self.pool.close()
+        if self.cursor:
+            await self.cursor.close()
+
     async def on_ready(self):
         print(f"🎉 Bot connected as {self.user}")
         print(f"📈 Connected to {len(self.guilds)} servers")
@@ -0,0 +1,43 @@
+"""
+Migration 04: Add composite index for available date lookups
+
+This migration adds:
+- idx_volunteers_taken_due index on volunteers(is_taken, due_date) so the
+  "upcoming unassigned dates" queries become a single index range scan
+"""
+
+
+async def check_migration_needed(conn):
+    """Check if this migration is needed"""
+    migrations_needed = []
+
+    # Check if the composite index exists
+    async with conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_volunteers_taken_due'"
+    ) as cursor:
+        if not await cursor.fetchone():
+            migrations_needed.append("Create idx_volunteers_taken_due index")
+
+    return migrations_needed
+
+
+async def apply_migration(conn):
+    """Apply this migration"""
+    print("📝 Applying Migration 04: Add composite index for available date lookups")
+
+    await conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_volunteers_taken_due
+        ON volunteers(is_taken, due_date)
+    """
+    )
+    print("  ✅ Created idx_volunteers_taken_due index")
+
+    await conn.commit()
+    print("✅ Migration 04 completed successfully!")
+
+
+# Migration metadata
+MIGRATION_ID = "04"
+MIGRATION_NAME = "add_taken_due_index"
+MIGRATION_DESCRIPTION = "Add (is_taken, due_date) index for available date lookups"
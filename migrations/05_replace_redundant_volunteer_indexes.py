@@ -0,0 +1,63 @@
+"""
+Migration 05: Replace redundant volunteers indexes with a covering index
+
+This migration:
+- adds idx_volunteers_name_taken_due on volunteers(name, is_taken, due_date),
+  which covers the per-user assignment lookups
+- drops idx_volunteers_is_taken (two distinct values, never selective)
+- drops idx_volunteers_name and idx_volunteers_name_taken, both prefixes of
+  the new index
+"""
+
+REDUNDANT_INDEXES = [
+    "idx_volunteers_is_taken",
+    "idx_volunteers_name",
+    "idx_volunteers_name_taken",
+]
+
+
+async def check_migration_needed(conn):
+    """Check if this migration is needed"""
+    migrations_needed = []
+
+    async with conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='volunteers'"
+    ) as cursor:
+        existing = {row[0] for row in await cursor.fetchall()}
+
+    if "idx_volunteers_name_taken_due" not in existing:
+        migrations_needed.append("Create idx_volunteers_name_taken_due index")
+
+    for index_name in REDUNDANT_INDEXES:
+        if index_name in existing:
+            migrations_needed.append(f"Drop {index_name} index")
+
+    return migrations_needed
+
+
+async def apply_migration(conn):
+    """Apply this migration"""
+    print("📝 Applying Migration 05: Replace redundant volunteers indexes")
+
+    await conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_volunteers_name_taken_due
+        ON volunteers(name, is_taken, due_date)
+    """
+    )
+    print("  ✅ Created idx_volunteers_name_taken_due index")
+
+    for index_name in REDUNDANT_INDEXES:
+        await conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+        print(f"  ✅ Dropped {index_name} index")
+
+    await conn.commit()
+    print("✅ Migration 05 completed successfully!")
+
+
+# Migration metadata
+MIGRATION_ID = "05"
+MIGRATION_NAME = "replace_redundant_volunteer_indexes"
+MIGRATION_DESCRIPTION = (
+    "Add (name, is_taken, due_date) index and drop indexes it makes redundant"
+)
@@ -53,10 +53,9 @@ CREATE TABLE IF NOT EXISTS applied_migrations (
 );
 
 -- Performance indexes for volunteers table
-CREATE INDEX IF NOT EXISTS idx_volunteers_name ON volunteers(name);
 CREATE INDEX IF NOT EXISTS idx_volunteers_due_date ON volunteers(due_date);
-CREATE INDEX IF NOT EXISTS idx_volunteers_is_taken ON volunteers(is_taken);
-CREATE INDEX IF NOT EXISTS idx_volunteers_name_taken ON volunteers(name, is_taken);
+CREATE INDEX IF NOT EXISTS idx_volunteers_taken_due ON volunteers(is_taken, due_date);
+CREATE INDEX IF NOT EXISTS idx_volunteers_name_taken_due ON volunteers(name, is_taken, due_date);
 
 -- Indexes for cache_entries table
 CREATE INDEX IF NOT EXISTS idx_cache_entries_key ON cache_entries(key);
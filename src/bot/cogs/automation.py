@@ -6,17 +6,12 @@ import asyncio
 import json
 import logging
 import os
-import sys
 import urllib.parse
-from pathlib import Path
 
 import arrow
 import discord
 from discord.ext import commands, tasks
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from utils.github import build_github_search_query, get_latest_weekly_report
 from utils.permissions import is_authorized_user
 
@@ -2,52 +2,51 @@
 Profile management commands - !profile, !settimezone
 """
 
-import sys
-from pathlib import Path
-
+import aiosqlite
 import discord
 from discord.ext import commands
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from ui import ProfileSetupView, TimezoneView
+from utils.timezone import get_display_name
+
+_SQL_USER_PROFILE = """
+    SELECT COALESCE(NULLIF(timezone, ''), 'UTC') AS timezone,
+           COALESCE(social_media_handle, '') AS social_media_handle,
+           COALESCE(NULLIF(preferred_reminder_time, ''), '09:00') AS preferred_reminder_time,
+           COALESCE(volunteer_name, '') AS volunteer_name,
+           (SELECT COUNT(*) FROM volunteers WHERE name = ? AND is_taken = 1) AS assignment_count
+    FROM volunteers
+    WHERE name = ?
+    LIMIT 1
+"""
 
 
 class ProfileCog(commands.Cog):
     """Commands for managing user profiles and settings"""
 
-    def __init__(self, bot, cursor):
+    def __init__(self, bot, pool):
         self.bot = bot
-        self.cursor = cursor
+        self.pool = pool
 
     async def _get_user_profile(self, user_name: str) -> dict:
-        """Get user's current profile data"""
-        async with self.cursor.execute(
-            """
-            SELECT timezone, social_media_handle, preferred_reminder_time, volunteer_name
-            FROM volunteers
-            WHERE name = ?
-            LIMIT 1
-            """,
-            (user_name,),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-            if row:
-                return {
-                    "timezone": row[0] or "UTC",
-                    "social_media_handle": row[1] or "",
-                    "preferred_reminder_time": row[2] or "09:00",
-                    "volunteer_name": row[3] or "",
-                }
-            else:
-                return {
-                    "timezone": "UTC",
-                    "social_media_handle": "",
-                    "preferred_reminder_time": "09:00",
-                    "volunteer_name": "",
-                }
+        """Get user's current profile data and active assignment count"""
+        async with self.pool.connection() as conn:
+            async with conn.execute(
+                _SQL_USER_PROFILE, (user_name, user_name)
+            ) as cursor:
+                cursor.row_factory = aiosqlite.Row
+                row = await cursor.fetchone()
+
+        if row:
+            return dict(row)
+        else:
+            return {
+                "timezone": "UTC",
+                "social_media_handle": "",
+                "preferred_reminder_time": "09:00",
+                "volunteer_name": "",
+                "assignment_count": 0,
+            }
 
     async def _create_profile_display_embed(
         self, user_name: str, profile: dict
@@ -59,16 +58,9 @@ class ProfileCog(commands.Cog):
             color=0x0C4B33,
         )
 
-        # Get user's assignment count
-        async with self.cursor.execute(
-            "SELECT COUNT(*) FROM volunteers WHERE name = ? AND is_taken = 1",
-            (user_name,),
-        ) as cursor:
-            assignment_count = (await cursor.fetchone())[0]
-
         embed.add_field(
             name="📅 Active Assignments",
-            value=f"{assignment_count} volunteer dates",
+            value=f"{profile['assignment_count']} volunteer dates",
             inline=True,
         )
 
@@ -80,12 +72,7 @@ class ProfileCog(commands.Cog):
         )
 
         # Timezone with friendly display
-        timezone_display = profile["timezone"]
-        if profile["timezone"] != "UTC":
-            from utils.timezone import get_display_name
-
-            timezone_display = get_display_name(profile["timezone"])
-
+        timezone_display = get_display_name(profile["timezone"])
         embed.add_field(name="🌍 Timezone", value=timezone_display, inline=True)
 
         # Reminder time
@@ -114,7 +101,7 @@ class ProfileCog(commands.Cog):
         user_name = ctx.author.display_name
 
         # Create profile setup view
-        profile_view = ProfileSetupView(self.cursor, user_name)
+        profile_view = ProfileSetupView(self.pool, user_name)
 
         # Get current profile for display
         current_profile = await self._get_user_profile(user_name)
@@ -127,7 +114,7 @@ class ProfileCog(commands.Cog):
         """Update your timezone with interactive dropdown"""
 
         # Create timezone selection view
-        view = TimezoneView(self.cursor)
+        view = TimezoneView()
 
         embed = discord.Embed(
             title="🌍 Update Your Timezone",
@@ -142,7 +129,7 @@ class ProfileCog(commands.Cog):
 
 async def setup(bot):
     """Setup function for loading the cog"""
-    cursor = getattr(bot, "cursor", None)
-    if cursor is None:
-        raise RuntimeError("Bot cursor not available")
-    await bot.add_cog(ProfileCog(bot, cursor))
+    pool = getattr(bot, "pool", None)
+    if pool is None:
+        raise RuntimeError("Bot connection pool not available")
+    await bot.add_cog(ProfileCog(bot, pool))
@@ -2,88 +2,95 @@
 Reporting commands - !report
 """
 
-import sys
-from pathlib import Path
-
+import aiosqlite
 from discord.ext import commands
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from utils.github import get_latest_weekly_report
 
+DISCORD_MESSAGE_LIMIT = 2000
+
+_SQL_REPORT_PROFILE = """
+    SELECT COALESCE(volunteer_name, '') AS volunteer_name,
+           COALESCE(social_media_handle, '') AS social_media_handle,
+           COALESCE(organization, '') AS organization,
+           COALESCE(NULLIF(organization_link, ''), 'https://djangonaut.space/')
+               AS organization_link
+    FROM volunteers
+    WHERE name = ?
+    LIMIT 1
+"""
+
 
 class ReportingCog(commands.Cog):
     """Commands for generating reports and summaries"""
 
-    def __init__(self, bot, cursor):
+    def __init__(self, bot, pool):
         self.bot = bot
-        self.cursor = cursor
+        self.pool = pool
+        # ((start_date, end_date), short_summary, list_modifying_prs)
+        self._formatted_cache = None
 
     @staticmethod
-    async def _format_report(data):
+    def _format_report(data):
         total_prs = data.get("total_prs", 0)
-        contributors = len({pr["author"] for pr in data["prs"]})
         first_timers = data.get("first_time_contributors", [])
-        modifying_prs = [pr for pr in data["prs"] if pr["modifies_release"]]
 
-        first_timer_msg = ""
-        if first_timers:
-            first_timer_msg = f"\n🎉 {len(first_timers)} first-time contributor."
+        authors, modifying_prs = set(), []
+        for pr in data["prs"]:
+            authors.add(pr["author"])
+            if pr["modifies_release"]:
+                modifying_prs.append(pr)
 
-        summary = (
-            f"✅ {total_prs} pull requests were merged by {contributors} contributors."
-            f"{first_timer_msg}"
-        )
+        parts = [
+            f"✅ {total_prs} pull requests were merged by {len(authors)} contributors."
+        ]
+        if first_timers:
+            parts.append(f"🎉 {len(first_timers)} first-time contributor.")
 
         if modifying_prs:
-            summary += (
-                f"\n📦 {len(modifying_prs)} PRs updated the release notes or docs:"
+            parts.append(
+                f"📦 {len(modifying_prs)} PRs updated the release notes or docs:"
             )
-            for pr in modifying_prs:
-                summary += f"\n🦄 [{pr['title']}](<{pr['url']}>)"
+            parts.extend(f"🦄 [{pr['title']}](<{pr['url']}>)" for pr in modifying_prs)
 
-        return summary
+        return "\n".join(parts)
 
     @staticmethod
-    async def _format_list_prs(data):
-        modifying_prs = [pr for pr in data["prs"] if pr["modifies_release"]]
-        list_modifying_prs = "There are no PRs that modify the release."
-
-        if modifying_prs:
-            list_modifying_prs = ""
-            for pr in modifying_prs:
-                list_modifying_prs += f"\n🦄 [{pr['title']}](<{pr['url']}>)"
-
-        return list_modifying_prs
+    def _format_list_prs(data):
+        list_modifying_prs = "".join(
+            f"\n🦄 [{pr['title']}](<{pr['url']}>)"
+            for pr in data["prs"]
+            if pr["modifies_release"]
+        )
+        return list_modifying_prs or "There are no PRs that modify the release."
+
+    def _get_formatted_report(self, data):
+        """Format a weekly report, reusing the output while the report is unchanged"""
+        key = (data["start_date"], data["end_date"])
+        if self._formatted_cache is None or self._formatted_cache[0] != key:
+            self._formatted_cache = (
+                key,
+                self._format_report(data),
+                self._format_list_prs(data),
+            )
+        return self._formatted_cache[1], self._formatted_cache[2]
 
     async def _get_user_profile(self, user_name: str) -> dict:
         """Get user's profile for report attribution"""
-        async with self.cursor.execute(
-            """
-            SELECT volunteer_name, social_media_handle, organization, organization_link
-            FROM volunteers
-            WHERE name = ?
-            LIMIT 1
-            """,
-            (user_name,),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-            if row:
-                return {
-                    "volunteer_name": row[0] or "",
-                    "social_media_handle": row[1] or "",
-                    "organization": row[2] or "",
-                    "organization_link": row[3] or "https://djangonaut.space/",
-                }
-            else:
-                return {
-                    "volunteer_name": "",
-                    "social_media_handle": "",
-                    "organization": "Djangonaut Space",
-                    "organization_link": "https://djangonaut.space/",
-                }
+        async with self.pool.connection() as conn:
+            async with conn.execute(_SQL_REPORT_PROFILE, (user_name,)) as cursor:
+                cursor.row_factory = aiosqlite.Row
+                row = await cursor.fetchone()
+
+        if row:
+            return dict(row)
+        else:
+            return {
+                "volunteer_name": "",
+                "social_media_handle": "",
+                "organization": "Djangonaut Space",
+                "organization_link": "https://djangonaut.space/",
+            }
 
     # ===== COMMANDS =====
 
@@ -94,7 +101,8 @@ class ReportingCog(commands.Cog):
         await self.bot.generate_pr_summary()
 
         # Get report data from database
-        pr_data = await get_latest_weekly_report(self.cursor)
+        async with self.pool.connection() as conn:
+            pr_data = await get_latest_weekly_report(conn)
 
         if not pr_data:
             await ctx.send(
@@ -102,8 +110,7 @@ class ReportingCog(commands.Cog):
             )
             return
 
-        short_summary = await ReportingCog._format_report(pr_data)
-        list_modifying_prs = await ReportingCog._format_list_prs(pr_data)
+        short_summary, list_modifying_prs = self._get_formatted_report(pr_data)
         last_week = pr_data["date_range_humanized"]
         discord_summary = await self.bot.disable_link_previews(pr_data["synopsis"])
 
@@ -160,14 +167,21 @@ class ReportingCog(commands.Cog):
                 f"💡 **Tip:** Use `!profile` to set your profile information for automatic insertion!"
             )
         else:
-            await ctx.send(f"📢 **Django Weekly Summary ({last_week})**")
-            await ctx.send(f"{short_summary}")
-            await ctx.send(f"🧑‍💻 **Synopsis**\n{discord_summary}")
+            header = f"📢 **Django Weekly Summary ({last_week})**\n{short_summary}"
+            synopsis = f"🧑‍💻 **Synopsis**\n{discord_summary}"
+            message = f"{header}\n{synopsis}"
+
+            # One message when it fits Discord's limit, otherwise split at the synopsis
+            if len(message) <= DISCORD_MESSAGE_LIMIT:
+                await ctx.send(message)
+            else:
+                await ctx.send(header)
+                await ctx.send(synopsis)
 
 
 async def setup(bot):
     """Setup function for loading the cog"""
-    cursor = getattr(bot, "cursor", None)
-    if cursor is None:
-        raise RuntimeError("Bot cursor not available")
-    await bot.add_cog(ReportingCog(bot, cursor))
+    pool = getattr(bot, "pool", None)
+    if pool is None:
+        raise RuntimeError("Bot connection pool not available")
+    await bot.add_cog(ReportingCog(bot, pool))
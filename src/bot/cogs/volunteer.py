@@ -3,26 +3,81 @@ Volunteer management commands - !volunteer, !unvolunteer, !available, !mydates,
 """
 
 import asyncio
-import sys
-from pathlib import Path
+import logging
+from datetime import datetime, timezone
 
 import aiosqlite
 import arrow
 import discord
 from discord.ext import commands
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from ui import (
+    SQL_ASSIGN_DATE,
+    SQL_UNASSIGN_DATE,
+    DatePickerView,
+    UserDatesView,
+    generate_date_list,
+    generate_user_date_summary,
+    invalidate_available_dates,
+)
+from utils.dates import days_until, format_date, today_iso
+
+logger = logging.getLogger(__name__)
+
+_SQL_LIST_AVAILABLE = """
+SELECT due_date
+FROM volunteers
+WHERE due_date > ? AND is_taken = 0
+LIMIT 10
+"""
 
-from ui import DatePickerView, UserDatesView, generate_date_list
+_SQL_NEXT_AVAILABLE = """
+SELECT due_date
+FROM volunteers
+WHERE due_date > ? AND is_taken = 0
+ORDER BY due_date ASC
+LIMIT 1
+"""
+
+_SQL_FIRST_ASSIGNED = """
+SELECT due_date
+FROM volunteers
+WHERE name = ? and is_taken = 1
+ORDER BY due_date ASC
+LIMIT 1
+"""
+
+# Capped at the 25 options a Discord dropdown can show; the window count
+# still reports how many dates are available in total
+_SQL_AVAILABLE_DATES = """
+SELECT due_date, COUNT(*) OVER ()
+FROM volunteers
+WHERE due_date > ? AND is_taken = 0
+ORDER BY due_date ASC
+LIMIT 25
+"""
+
+_SQL_USER_DATES_STATUS = """
+SELECT due_date, status
+FROM volunteers
+WHERE name = ? AND is_taken = 1
+ORDER BY due_date ASC
+"""
+
+_SQL_DATE_STATUS = """
+SELECT due_date, status, name
+FROM volunteers
+WHERE due_date >= ? AND is_taken = 1
+ORDER BY due_date
+"""
 
 
 class VolunteerCog(commands.Cog):
     """Commands for managing volunteer assignments"""
 
-    def __init__(self, bot, cursor):
+    def __init__(self, bot, pool):
         self.bot = bot
-        self.cursor = cursor
+        self.pool = pool
 
     @staticmethod
     def _is_date_correct(m):
@@ -34,72 +89,44 @@ class VolunteerCog(commands.Cog):
 
     @staticmethod
     async def _list_available_dates(conn: aiosqlite.Connection) -> str | None:
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
+        current_date = today_iso()
 
-        async with conn.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE due_date > ? AND is_taken = 0
-            LIMIT 10
-            """,
-            (current_date,),
-        ) as cursor:
+        async with conn.execute(_SQL_LIST_AVAILABLE, (current_date,)) as cursor:
             rows = await cursor.fetchall()
 
         if not rows:
             return None
-        return "\\n".join(
-            f"- {arrow.get(row[0]).format('Do MMMM YYYY')}" for row in rows
-        )
+        return "\\n".join(f"- {format_date(row[0], '{Do} %B %Y')}" for row in rows)
 
     @staticmethod
     async def _get_next_available_date(conn: aiosqlite.Connection) -> str | None:
         """Returns the next available date (the closer with is_taken = 0)."""
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
+        current_date = today_iso()
 
-        async with conn.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE due_date > ? AND is_taken = 0
-            ORDER BY due_date ASC
-            LIMIT 1
-            """,
-            (current_date,),
-        ) as cursor:
+        async with conn.execute(_SQL_NEXT_AVAILABLE, (current_date,)) as cursor:
             row = await cursor.fetchone()
             return row[0] if row else None
 
-    @staticmethod
     async def _update_volunteer_status(
-        conn: aiosqlite.Connection, date: str, name: str, is_taken: int
+        self, date: str, name: str, is_taken: int
     ) -> bool:
-        query = """
-            UPDATE volunteers
-            SET
-                is_taken = ?,
-                name = CASE WHEN ? THEN ? ELSE name END
-            WHERE
-                due_date = ? AND (? = 1 OR name = ?)"""
-        async with conn.execute(
-            query, (is_taken, is_taken, name, date, is_taken, name)
-        ) as cursor:
-            await conn.commit()
-            return cursor.rowcount > 0
+        if is_taken:
+            sql, params = SQL_ASSIGN_DATE, (name, date)
+        else:
+            sql, params = SQL_UNASSIGN_DATE, (date, name)
+
+        try:
+            updated = await self.bot.write_queue.submit(sql, params)
+        except Exception as e:
+            logger.error("Volunteer status update for %s failed: %s", date, e)
+            return False
+        return updated > 0
 
     @staticmethod
     async def get_user_first_assigned_date(conn: aiosqlite.Connection, ctx):
         """Return the next assigned date to the user."""
         async with conn.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE name = ? and is_taken = 1
-            ORDER BY due_date ASC
-            LIMIT 1
-            """,
-            (ctx.author.display_name,),
+            _SQL_FIRST_ASSIGNED, (ctx.author.display_name,)
         ) as cursor:
             row = await cursor.fetchone()
 
@@ -129,11 +156,12 @@ class VolunteerCog(commands.Cog):
 
         is_taken = 1 if action == "assign" else 0
 
-        updated = await VolunteerCog._update_volunteer_status(
-            self.cursor, date, ctx.author.display_name, is_taken
+        updated = await self._update_volunteer_status(
+            date, ctx.author.display_name, is_taken
         )
 
         if updated:
+            invalidate_available_dates()
             await ctx.send(success_msg.format(date=date))
             if post_success_note:
                 await ctx.send(post_success_note)
@@ -141,39 +169,27 @@ class VolunteerCog(commands.Cog):
             await ctx.send(failure_msg)
 
     async def _get_available_dates_list(self):
-        """Get list of available dates"""
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
-        async with self.cursor.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE due_date > ? AND is_taken = 0
-            ORDER BY due_date ASC
-            """,
-            (current_date,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [row[0] for row in rows]
+        """Get the first page of available dates and the total available"""
+        current_date = today_iso()
+        async with self.pool.connection() as conn:
+            async with conn.execute(_SQL_AVAILABLE_DATES, (current_date,)) as cursor:
+                rows = await cursor.fetchall()
+        total = rows[0][1] if rows else 0
+        return [row[0] for row in rows], total
 
     async def _get_user_dates_with_status(self, user_name):
         """Get user's assigned dates with status"""
-        async with self.cursor.execute(
-            """
-            SELECT due_date, status
-            FROM volunteers
-            WHERE name = ? AND is_taken = 1
-            ORDER BY due_date ASC
-            """,
-            (user_name,),
-        ) as cursor:
-            return await cursor.fetchall()
+        async with self.pool.connection() as conn:
+            async with conn.execute(_SQL_USER_DATES_STATUS, (user_name,)) as cursor:
+                return await cursor.fetchall()
 
     # ===== COMMANDS =====
 
     @commands.command(name="available")
     async def available(self, ctx):
         """List available volunteer dates"""
-        response = await VolunteerCog._list_available_dates(self.cursor)
+        async with self.pool.connection() as conn:
+            response = await VolunteerCog._list_available_dates(conn)
         await ctx.send(response or "No available dates found.")
 
     @commands.command(name="volunteer")
@@ -183,10 +199,10 @@ class VolunteerCog(commands.Cog):
 
     async def _show_volunteer_picker(self, ctx):
         """Show interactive date picker for volunteering"""
-        picker_view = DatePickerView(self.cursor, action="assign")
+        picker_view = DatePickerView(self.pool, action="assign")
         await picker_view.setup_options()
 
-        available_dates = await self._get_available_dates_list()
+        available_dates, total_available = await self._get_available_dates_list()
 
         if not available_dates:
             await ctx.send(
@@ -196,13 +212,15 @@ class VolunteerCog(commands.Cog):
             )
             return
 
-        preview = generate_date_list(available_dates, limit=5)
+        preview = generate_date_list(available_dates, limit=5, total=total_available)
 
         if len(preview) > 3500:
-            preview = generate_date_list(available_dates, limit=3)
+            preview = generate_date_list(
+                available_dates, limit=3, total=total_available
+            )
 
-        if len(available_dates) > 5:
-            preview += f"\\n\\n📝 *Use the dropdown below to see all {len(available_dates)} available dates*"
+        if total_available > 5:
+            preview += f"\\n\\n📝 *Use the dropdown below to see all {total_available} available dates*"
 
         embed = discord.Embed(
             title="📅 Volunteer for Django News",
@@ -218,9 +236,8 @@ class VolunteerCog(commands.Cog):
         """Unvolunteer from a date - shows interactive picker"""
 
         if option and option.lower() == "next":
-            next_date = await VolunteerCog.get_user_first_assigned_date(
-                self.cursor, ctx
-            )
+            async with self.pool.connection() as conn:
+                next_date = await VolunteerCog.get_user_first_assigned_date(conn, ctx)
             if not next_date:
                 await ctx.send("📅 You don't have any assigned dates.")
                 return
@@ -242,7 +259,7 @@ class VolunteerCog(commands.Cog):
         """Show interactive date picker for unvolunteering"""
         user_name = ctx.author.display_name
 
-        user_dates_view = UserDatesView(self.cursor, user_name)
+        user_dates_view = UserDatesView(self.pool, user_name)
         await user_dates_view.setup_options()
 
         user_dates = await self._get_user_dates_with_status(user_name)
@@ -255,8 +272,6 @@ class VolunteerCog(commands.Cog):
             )
             return
 
-        from ui.calendar_view import generate_user_date_summary
-
         preview = generate_user_date_summary(user_dates)
 
         embed = discord.Embed(
@@ -286,8 +301,6 @@ class VolunteerCog(commands.Cog):
             await ctx.send("📅 You have no assigned dates.")
             return
 
-        from ui.calendar_view import generate_user_date_summary
-
         summary = generate_user_date_summary(user_dates)
         await ctx.send(summary)
 
@@ -314,8 +327,6 @@ class VolunteerCog(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        from ui.calendar_view import generate_user_date_summary
-
         summary = generate_user_date_summary(user_dates)
 
         embed = discord.Embed(
@@ -332,15 +343,16 @@ class VolunteerCog(commands.Cog):
             inline=False,
         )
 
-        next_assignment = min(user_dates, key=lambda x: x[0])
-        next_date = arrow.get(next_assignment[0]).format("dddd, MMMM Do YYYY")
-        days_until = (arrow.get(next_assignment[0]) - arrow.utcnow()).days
+        # Rows are ordered by due_date, so the first one is the next assignment
+        next_due = user_dates[0][0]
+        next_date = format_date(next_due)
+        days_left = days_until(next_due, datetime.now(timezone.utc))
 
-        if days_until >= 0:
-            urgency_msg = f"Next assignment: **{next_date}** ({days_until} days)"
+        if days_left >= 0:
+            urgency_msg = f"Next assignment: **{next_date}** ({days_left} days)"
         else:
             urgency_msg = (
-                f"Overdue assignment: **{next_date}** ({abs(days_until)} days ago)"
+                f"Overdue assignment: **{next_date}** ({abs(days_left)} days ago)"
             )
 
         embed.set_footer(text=urgency_msg)
@@ -349,34 +361,25 @@ class VolunteerCog(commands.Cog):
     @commands.command(name="status")
     async def get_date_status(self, ctx):
         """Show status of all volunteer assignments"""
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
-        async with self.cursor.execute(
-            """
-            SELECT due_date, status, name
-            FROM volunteers
-            WHERE due_date >= ? AND is_taken = 1
-            """,
-            (current_date,),
-        ) as cursor:
-            rows = await cursor.fetchall()
+        current_date = today_iso()
+        async with self.pool.connection() as conn:
+            async with conn.execute(_SQL_DATE_STATUS, (current_date,)) as cursor:
+                rows = await cursor.fetchall()
 
         if not rows:
             await ctx.send("No upcoming dates has been assigned.")
             return
 
-        messages = []
-        for due_date, status, name in rows:
-            date_str = arrow.get(due_date).format("Do MMM YYYY")
-            messages.append(
-                f"Date: `{date_str}`\\nStatus: `{status}`\\nTaken By: `{name}`"
-            )
-        output = "\\n\\n".join(messages)
+        output = "\\n\\n".join(
+            f"Date: `{format_date(due_date, '{Do} %b %Y')}`\\nStatus: `{status}`\\nTaken By: `{name}`"
+            for due_date, status, name in rows
+        )
         await ctx.send(output)
 
 
 async def setup(bot):
     """Setup function for loading the cog"""
-    cursor = getattr(bot, "cursor", None)
-    if cursor is None:
-        raise RuntimeError("Bot cursor not available")
-    await bot.add_cog(VolunteerCog(bot, cursor))
+    pool = getattr(bot, "pool", None)
+    if pool is None:
+        raise RuntimeError("Bot connection pool not available")
+    await bot.add_cog(VolunteerCog(bot, pool))
@@ -6,6 +6,8 @@ import logging
 
 import aiosqlite
 
+from .pool import configure_connection
+
 
 async def migrate_database(db_path: str):
     """
@@ -14,42 +16,40 @@ async def migrate_database(db_path: str):
     logger = logging.getLogger(__name__)
 
     async with aiosqlite.connect(db_path) as conn:
-        # Check if new columns exist
-        async with conn.execute("PRAGMA table_info(volunteers)") as cursor:
-            columns = await cursor.fetchall()
-            column_names = [col[1] for col in columns]
+        # Switches the database to WAL on first run
+        await configure_connection(conn)
 
-        migrations_needed = []
+        # Columns added for profile functionality, keyed by column name
+        pending = {
+            "social_media_handle": "ALTER TABLE volunteers ADD COLUMN social_media_handle TEXT",
+            "preferred_reminder_time": "ALTER TABLE volunteers ADD COLUMN preferred_reminder_time TEXT DEFAULT '09:00'",
+            "volunteer_name": "ALTER TABLE volunteers ADD COLUMN volunteer_name TEXT",
+        }
 
-        # Check for each new column
-        if "social_media_handle" not in column_names:
-            migrations_needed.append(
-                "ALTER TABLE volunteers ADD COLUMN social_media_handle TEXT"
-            )
-
-        if "preferred_reminder_time" not in column_names:
-            migrations_needed.append(
-                "ALTER TABLE volunteers ADD COLUMN preferred_reminder_time TEXT DEFAULT '09:00'"
-            )
+        # Walk the column list lazily and stop once every column is found
+        async with conn.execute("PRAGMA table_info(volunteers)") as cursor:
+            async for col in cursor:
+                pending.pop(col[1], None)
+                if not pending:
+                    break
 
-        if "volunteer_name" not in column_names:
-            migrations_needed.append(
-                "ALTER TABLE volunteers ADD COLUMN volunteer_name TEXT"
-            )
+        migrations_needed = list(pending.values())
 
-        # Run migrations
+        # Run migrations in a single transaction (one lock cycle, one fsync)
         if migrations_needed:
             logger.info("Running %s database migrations...", len(migrations_needed))
 
+            await conn.execute("BEGIN IMMEDIATE")
             for migration in migrations_needed:
                 try:
                     await conn.execute(migration)
-                    logger.info("Executed: %s", migration)
                 except Exception as e:
                     logger.error("Migration failed: %s - %s", migration, e)
+                    await conn.rollback()
                     raise
 
             await conn.commit()
+            logger.info("Executed: %s", "; ".join(migrations_needed))
             logger.info("Database migrations completed successfully!")
         else:
             logger.info("No database migrations needed - schema is up to date")
@@ -62,17 +62,21 @@ async def create_indexes(db_path: str):
     logger = logging.getLogger(__name__)
 
     async with aiosqlite.connect(db_path) as conn:
+        await configure_connection(conn)
         indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_volunteers_name ON volunteers(name)",
             "CREATE INDEX IF NOT EXISTS idx_volunteers_due_date ON volunteers(due_date)",
-            "CREATE INDEX IF NOT EXISTS idx_volunteers_is_taken ON volunteers(is_taken)",
-            "CREATE INDEX IF NOT EXISTS idx_volunteers_name_taken ON volunteers(name, is_taken)",
+            "CREATE INDEX IF NOT EXISTS idx_volunteers_taken_due ON volunteers(is_taken, due_date)",
+            "CREATE INDEX IF NOT EXISTS idx_volunteers_name_taken_due ON volunteers(name, is_taken, due_date)",
+            # Superseded by the composite indexes above
+            "DROP INDEX IF EXISTS idx_volunteers_is_taken",
+            "DROP INDEX IF EXISTS idx_volunteers_name",
+            "DROP INDEX IF EXISTS idx_volunteers_name_taken",
         ]
 
         for index_sql in indexes:
             try:
                 await conn.execute(index_sql)
-                logger.debug("Created index: %s", index_sql)
+                logger.debug("Executed: %s", index_sql)
             except Exception as e:
                 logger.error("Index creation failed: %s - %s", index_sql, e)
 
@@ -0,0 +1,64 @@
+"""
+SQLite connection pool for Django News Bot
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA foreign_keys=ON",
+]
+
+
+async def configure_connection(conn: aiosqlite.Connection):
+    """Apply the standard pragmas to a freshly opened connection"""
+    for pragma in PRAGMAS:
+        await conn.execute(pragma)
+
+
+class SQLiteConnectionPool:
+    """
+    Small pool of aiosqlite connections.
+
+    Each connection runs on its own worker thread, so concurrent commands
+    no longer queue up behind a single shared connection.
+    """
+
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        self.size = size
+        self._connections = []
+        self._available = asyncio.Queue()
+
+    async def open(self):
+        """Open all pooled connections"""
+        for _ in range(self.size):
+            conn = await aiosqlite.connect(self.db_path)
+            await configure_connection(conn)
+            self._connections.append(conn)
+            self._available.put_nowait(conn)
+
+    async def close(self):
+        """Close all pooled connections"""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection for the duration of the block"""
+        conn = await self._available.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                await conn.rollback()
+            self._available.put_nowait(conn)
@@ -2,8 +2,14 @@
 UI components for Django News Bot
 """
 
-from .calendar_view import generate_date_list
-from .date_picker import DatePickerView, UserDatesView
+from .calendar_view import generate_date_list, generate_user_date_summary
+from .date_picker import (
+    SQL_ASSIGN_DATE,
+    SQL_UNASSIGN_DATE,
+    DatePickerView,
+    UserDatesView,
+    invalidate_available_dates,
+)
 from .profile_modal import (
     CustomTimezoneModal,
     ProfileModal,
@@ -15,7 +21,11 @@ from .timezone_view import TimezoneView
 __all__ = [
     "DatePickerView",
     "UserDatesView",
+    "invalidate_available_dates",
+    "SQL_ASSIGN_DATE",
+    "SQL_UNASSIGN_DATE",
     "generate_date_list",
+    "generate_user_date_summary",
     "ProfileModal",
     "ProfileSetupView",
     "TimezoneSelectView",
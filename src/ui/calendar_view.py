@@ -2,18 +2,22 @@
 Date list utilities for displaying available dates
 """
 
-from typing import List, Tuple
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
-import arrow
+from utils.dates import days_until, format_date
 
 
-def generate_date_list(available_dates: List[str], limit: int = 10) -> str:
+def generate_date_list(
+    available_dates: List[str], limit: int = 10, total: Optional[int] = None
+) -> str:
     """
     Generate a simple list of available dates
 
     Args:
         available_dates: List of available dates in YYYY-MM-DD format
         limit: Maximum number of dates to show
+        total: Total available dates, if more exist than were fetched
 
     Returns:
         Formatted date list string
@@ -22,32 +26,34 @@ def generate_date_list(available_dates: List[str], limit: int = 10) -> str:
         return "📅 No available dates found."
 
     date_lines = []
+    now = datetime.now(timezone.utc)
 
     for i, date_str in enumerate(available_dates[:limit]):
-        date_obj = arrow.get(date_str)
-        formatted_date = date_obj.format("dddd, MMMM Do YYYY")
-        days_until = (date_obj - arrow.utcnow()).days
+        formatted_date = format_date(date_str)
+        days_left = days_until(date_str, now)
 
-        if days_until < 0:
+        if days_left < 0:
             continue  # Skip past dates
 
         # Create urgency indicator
-        if days_until == 0:
+        if days_left == 0:
             urgency = "📍 Due Today!"
-        elif days_until <= 3:
-            urgency = f"🔴 {days_until} days - Urgent!"
-        elif days_until <= 7:
-            urgency = f"🟡 {days_until} days"
+        elif days_left <= 3:
+            urgency = f"🔴 {days_left} days - Urgent!"
+        elif days_left <= 7:
+            urgency = f"🟡 {days_left} days"
         else:
-            urgency = f"🟢 {days_until} days"
+            urgency = f"🟢 {days_left} days"
 
         # Format as a single line to avoid embed issues
         date_lines.append(f"`{i + 1:2d}.` **{formatted_date}** - {urgency}")
 
     result = "📅 **Available Volunteer Dates:**\n\n" + "\n".join(date_lines)
 
-    if len(available_dates) > limit:
-        result += f"\n\n*... and {len(available_dates) - limit} more dates available*"
+    if total is None:
+        total = len(available_dates)
+    if total > limit:
+        result += f"\n\n*... and {total - limit} more dates available*"
 
     return result
 
@@ -66,11 +72,11 @@ def generate_user_date_summary(user_dates: List[Tuple[str, str]]) -> str:
         return "📅 You have no assigned volunteer dates."
 
     summary_lines = []
+    now = datetime.now(timezone.utc)
 
     for i, (date_str, status) in enumerate(user_dates):
-        date_obj = arrow.get(date_str)
-        formatted_date = date_obj.format("dddd, MMMM Do YYYY")
-        days_until = (date_obj - arrow.utcnow()).days
+        formatted_date = format_date(date_str)
+        days_left = days_until(date_str, now)
 
         # Status emoji
         status_emoji = {
@@ -81,14 +87,14 @@ def generate_user_date_summary(user_dates: List[Tuple[str, str]]) -> str:
         }.get(status.lower(), "📝")
 
         # Urgency indicator
-        if days_until < 0:
-            urgency = f"🔴 Overdue ({abs(days_until)} days)"
-        elif days_until == 0:
+        if days_left < 0:
+            urgency = f"🔴 Overdue ({abs(days_left)} days)"
+        elif days_left == 0:
             urgency = "📍 Due Today!"
-        elif days_until <= 3:
-            urgency = f"🟡 Due in {days_until} days"
+        elif days_left <= 3:
+            urgency = f"🟡 Due in {days_left} days"
         else:
-            urgency = f"🟢 {days_until} days away"
+            urgency = f"🟢 {days_left} days away"
 
         summary_lines.append(
             f"`{i + 1:2d}.` {status_emoji} **{formatted_date}** - {status.title()} - {urgency}"
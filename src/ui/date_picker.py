@@ -2,63 +2,167 @@
 Date picker UI components for volunteer management
 """
 
-import arrow
+import asyncio
+import logging
+from functools import lru_cache
+from time import monotonic
+
 import discord
 from discord import SelectOption
 from discord.ui import Select, View
 
+from utils.dates import format_date
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched list of available dates is reused. Every bot write that
+# changes volunteers calls invalidate_available_dates(); edits made outside
+# the bot (migrate.py, manual SQL) show up once this window expires
+AVAILABLE_DATES_TTL = 30
+
+# (monotonic expiry, available dates) shared by every DatePickerView
+_available_dates_cache = (0.0, [])
+
+_SQL_AVAILABLE_DATES = """
+SELECT due_date
+FROM volunteers
+WHERE due_date > DATE('now') AND is_taken = 0
+ORDER BY due_date ASC
+LIMIT 25
+"""
+
+_SQL_USER_ASSIGNED = """
+SELECT due_date
+FROM volunteers
+WHERE name = ? AND is_taken = 1 AND due_date > DATE('now')
+ORDER BY due_date ASC
+LIMIT 25
+"""
+
+# Shared with VolunteerCog so both paths apply the same ownership rules:
+# only a free date can be taken, and only its holder can release it
+SQL_ASSIGN_DATE = """
+UPDATE volunteers
+SET is_taken = 1, name = ?
+WHERE due_date = ? AND is_taken = 0
+"""
+
+SQL_UNASSIGN_DATE = """
+UPDATE volunteers
+SET is_taken = 0, name = NULL
+WHERE due_date = ? AND name = ?
+"""
+
+_SQL_USER_DATES_STATUS = """
+SELECT due_date, status
+FROM volunteers
+WHERE name = ? AND is_taken = 1
+ORDER BY due_date ASC
+"""
+
+
+def invalidate_available_dates():
+    """Drop the cached available dates after an assignment changes"""
+    global _available_dates_cache
+    _available_dates_cache = (0.0, [])
+
+
+# Strong references to fire-and-forget edits so they are not garbage collected
+_background_edits = set()
+
+
+def _on_edit_done(task: asyncio.Task):
+    _background_edits.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.warning("Failed to disable view: %s", task.exception())
+
+
+def _edit_in_background(coro):
+    """Schedule a cosmetic message edit without waiting on the HTTP round trip"""
+    task = asyncio.create_task(coro)
+    _background_edits.add(task)
+    task.add_done_callback(_on_edit_done)
+
+
+_DESC_PREFIX = "Due: "
+
+# Per-action dropdown text for DatePickerView
+_ACTION_SPEC = {
+    "assign": {
+        "placeholder": "📅 Choose a date to volunteer for...",
+        "desc_suffix": " • Available",
+        "emoji": "📅",
+        "no_dates_label": "No available dates",
+        "no_dates_error": "❌ No available dates to volunteer for.",
+    },
+    "unassign": {
+        "placeholder": "📅 Choose a date to unvolunteer from...",
+        "desc_suffix": " • Your assignment",
+        "emoji": "📝",
+        "no_dates_label": "No assigned dates",
+        "no_dates_error": "❌ You have no assigned dates to unvolunteer from.",
+    },
+}
+
+
+# Options depend only on their arguments, so they are shared between views
+# rather than rebuilt on every render
+@lru_cache(maxsize=256)
+def _action_option(date: str, action: str) -> SelectOption:
+    """Build the DatePickerView option for a date to assign or unassign"""
+    spec = _ACTION_SPEC[action]
+    return SelectOption(
+        label=format_date(date),
+        description=_DESC_PREFIX + format_date(date, "%b {D}") + spec["desc_suffix"],
+        value=date,
+        emoji=spec["emoji"],
+    )
+
+
+@lru_cache(maxsize=256)
+def _status_option(date: str, status: str) -> SelectOption:
+    """Build the UserDatesView option for an assigned date and its status"""
+    return SelectOption(
+        label=f"{format_date(date, '%b {D}, %Y')} - {status.title()}",
+        description=format_date(date),
+        value=date,
+        emoji="📝" if status == "pending" else "✅",
+    )
+
 
 class DatePickerView(View):
     """Interactive date picker for volunteering"""
 
-    def __init__(self, cursor, action="assign", user_name=None):
+    def __init__(self, pool, action="assign", user_name=None):
         super().__init__(timeout=300)  # 5 minute timeout
-        self.cursor = cursor
+        self.pool = pool
         self.action = action  # "assign" or "unassign"
         self.user_name = user_name
         self.selected_date = None
         self.date_select = None
+        # Dates offered in the dropdown that can still be acted on
+        self._valid_dates = set()
 
     async def setup_options(self):
         """Setup the dropdown options based on action type"""
+        spec = _ACTION_SPEC[self.action]
         if self.action == "assign":
             dates = await self._get_available_dates()
-            placeholder = "📅 Choose a date to volunteer for..."
-            options = [
-                SelectOption(
-                    label=arrow.get(date).format("dddd, MMMM Do YYYY"),
-                    description=f"Due: {arrow.get(date).format('MMM D')} • Available",
-                    value=date,
-                    emoji="📅",
-                )
-                for date in dates[:25]  # Discord limit of 25 options
-            ]
         else:  # unassign
             dates = await self._get_user_assigned_dates()
-            placeholder = "📅 Choose a date to unvolunteer from..."
-            options = [
-                SelectOption(
-                    label=arrow.get(date).format("dddd, MMMM Do YYYY"),
-                    description=f"Due: {arrow.get(date).format('MMM D')} • Your assignment",
-                    value=date,
-                    emoji="📝",
-                )
-                for date in dates[:25]
-            ]
+
+        dates = dates[:25]  # Discord limit of 25 options
+        options = [_action_option(date, self.action) for date in dates]
+        self._valid_dates = set(dates)
 
         if not options:
             # Create a disabled option to show no dates available
-            if self.action == "assign":
-                options = [
-                    SelectOption(label="No available dates", value="none", emoji="❌")
-                ]
-            else:
-                options = [
-                    SelectOption(label="No assigned dates", value="none", emoji="❌")
-                ]
+            options = [
+                SelectOption(label=spec["no_dates_label"], value="none", emoji="❌")
+            ]
 
         self.date_select = Select(
-            placeholder=placeholder,
+            placeholder=spec["placeholder"],
             options=options,
             disabled=len(options) == 1 and options[0].value == "none",
         )
@@ -66,48 +170,29 @@ class DatePickerView(View):
         self.add_item(self.date_select)
 
     async def _get_available_dates(self):
-        """Get list of available volunteer dates"""
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
-        async with self.cursor.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE due_date > ? AND is_taken = 0
-            ORDER BY due_date ASC
-            LIMIT 25
-            """,
-            (current_date,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [row[0] for row in rows]
+        """Get list of available volunteer dates, reused for a short TTL"""
+        global _available_dates_cache
+        expires_at, dates = _available_dates_cache
+        clock = monotonic()
+        if clock >= expires_at:
+            async with self.pool.connection() as conn:
+                rows = await conn.execute_fetchall(_SQL_AVAILABLE_DATES)
+            dates = [row[0] for row in rows]
+            _available_dates_cache = (clock + AVAILABLE_DATES_TTL, dates)
+        return dates
 
     async def _get_user_assigned_dates(self):
         """Get list of user's assigned dates"""
-        current_date = arrow.utcnow().format("YYYY-MM-DD")
-        async with self.cursor.execute(
-            """
-            SELECT due_date
-            FROM volunteers
-            WHERE name = ? AND is_taken = 1 AND due_date > ?
-            ORDER BY due_date ASC
-            LIMIT 25
-            """,
-            (self.user_name, current_date),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [row[0] for row in rows]
+        async with self.pool.connection() as conn:
+            rows = await conn.execute_fetchall(_SQL_USER_ASSIGNED, (self.user_name,))
+        return [row[0] for row in rows]
 
     async def date_selected(self, interaction: discord.Interaction):
         """Handle date selection"""
         if self.date_select.values[0] == "none":
-            if self.action == "assign":
-                await interaction.response.send_message(
-                    "❌ No available dates to volunteer for.", ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    "❌ You have no assigned dates to unvolunteer from.", ephemeral=True
-                )
+            await interaction.response.send_message(
+                _ACTION_SPEC[self.action]["no_dates_error"], ephemeral=True
+            )
             return
 
         self.selected_date = self.date_select.values[0]
@@ -117,43 +202,47 @@ class DatePickerView(View):
         """Process the volunteer assign/unassign action"""
         date = self.selected_date
         user_name = interaction.user.display_name
-        is_taken = 1 if self.action == "assign" else 0
 
-        # Update database
-        query = """
-            UPDATE volunteers
-            SET
-                is_taken = ?,
-                name = CASE WHEN ? THEN ? ELSE name END
-            WHERE
-                due_date = ? AND (? = 1 OR name = ?)
-        """
-        async with self.cursor.execute(
-            query, (is_taken, is_taken, user_name, date, is_taken, user_name)
-        ) as cursor:
-            await self.cursor.commit()
-            success = cursor.rowcount > 0
+        # Acknowledge first so a slow queued write can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        # Dates already handled through this view fail without a database write
+        success = False
+        if date in self._valid_dates:
+            if self.action == "assign":
+                sql, params = SQL_ASSIGN_DATE, (user_name, date)
+            else:
+                sql, params = SQL_UNASSIGN_DATE, (date, user_name)
+            try:
+                updated = await interaction.client.write_queue.submit(sql, params)
+            except Exception as e:
+                logger.error("Volunteer %s for %s failed: %s", self.action, date, e)
+                updated = 0
+            success = updated > 0
+            if success:
+                self._valid_dates.discard(date)
+                invalidate_available_dates()
 
         # Send response
-        formatted_date = arrow.get(date).format("dddd, MMMM Do YYYY")
+        formatted_date = format_date(date)
 
         if success:
             if self.action == "assign":
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"✅ **Successfully volunteered!**\n"
                     f"📅 You've been assigned to: **{formatted_date}**\n"
                     f"📝 You'll receive reminders as the date approaches.",
                     ephemeral=True,
                 )
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"✅ **Successfully unvolunteered!**\n"
                     f"📅 You've been removed from: **{formatted_date}**\n"
                     f"💬 Please inform folks on django-news channel so others can pick it up.",
                     ephemeral=True,
                 )
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ **Action failed!**\n"
                 f"Could not {'assign you to' if self.action == 'assign' else 'remove you from'} {formatted_date}. "
                 f"Please try again or contact an admin.",
@@ -163,15 +252,15 @@ class DatePickerView(View):
         # Disable the view after use
         for item in self.children:
             item.disabled = True
-        await interaction.edit_original_response(view=self)
+        _edit_in_background(interaction.edit_original_response(view=self))
 
 
 class UserDatesView(View):
     """View to show user's assigned dates with options to unvolunteer"""
 
-    def __init__(self, cursor, user_name):
+    def __init__(self, pool, user_name):
         super().__init__(timeout=300)
-        self.cursor = cursor
+        self.pool = pool
         self.user_name = user_name
         # Placeholder for the dropdown select; initialized in setup_options()
         self.date_select = None
@@ -185,17 +274,7 @@ class UserDatesView(View):
                 SelectOption(label="No assigned dates", value="none", emoji="❌")
             ]
         else:
-            options = []
-            for date, status in dates_data[:25]:
-                formatted_date = arrow.get(date).format("MMM D, YYYY")
-                options.append(
-                    SelectOption(
-                        label=f"{formatted_date} - {status.title()}",
-                        description=arrow.get(date).format("dddd, MMMM Do YYYY"),
-                        value=date,
-                        emoji="📝" if status == "pending" else "✅",
-                    )
-                )
+            options = [_status_option(date, status) for date, status in dates_data[:25]]
 
         self.date_select = Select(
             placeholder="📋 Your assigned dates (select to unvolunteer)...",
@@ -207,16 +286,10 @@ class UserDatesView(View):
 
     async def _get_user_dates_with_status(self):
         """Get user's assigned dates with their status"""
-        async with self.cursor.execute(
-            """
-            SELECT due_date, status
-            FROM volunteers
-            WHERE name = ? AND is_taken = 1
-            ORDER BY due_date ASC
-            """,
-            (self.user_name,),
-        ) as cursor:
-            return await cursor.fetchall()
+        async with self.pool.connection() as conn:
+            return await conn.execute_fetchall(
+                _SQL_USER_DATES_STATUS, (self.user_name,)
+            )
 
     async def date_selected(self, interaction: discord.Interaction):
         """Handle date selection for unvolunteering"""
@@ -227,12 +300,10 @@ class UserDatesView(View):
             return
 
         selected_date = self.date_select.values[0]
-        formatted_date = arrow.get(selected_date).format("dddd, MMMM Do YYYY")
+        formatted_date = format_date(selected_date)
 
         # Create confirmation view
-        confirm_view = ConfirmUnvolunteerView(
-            self.cursor, selected_date, self.user_name
-        )
+        confirm_view = ConfirmUnvolunteerView(selected_date, self.user_name)
 
         await interaction.response.send_message(
             f"🤔 **Confirm Unvolunteer**\n"
@@ -247,9 +318,8 @@ class UserDatesView(View):
 class ConfirmUnvolunteerView(View):
     """Confirmation dialog for unvolunteering"""
 
-    def __init__(self, cursor, date, user_name):
+    def __init__(self, date, user_name):
         super().__init__(timeout=60)
-        self.cursor = cursor
         self.date = date
         self.user_name = user_name
 
@@ -260,29 +330,32 @@ class ConfirmUnvolunteerView(View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Confirm and process unvolunteering"""
+        # Acknowledge first so a slow queued write can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         # Update database
-        async with self.cursor.execute(
-            """
-            UPDATE volunteers
-            SET is_taken = 0, name = NULL
-            WHERE due_date = ? AND name = ?
-            """,
-            (self.date, self.user_name),
-        ) as cursor:
-            await self.cursor.commit()
-            success = cursor.rowcount > 0
-
-        formatted_date = arrow.get(self.date).format("dddd, MMMM Do YYYY")
+        try:
+            updated = await interaction.client.write_queue.submit(
+                SQL_UNASSIGN_DATE, (self.date, self.user_name)
+            )
+        except Exception as e:
+            logger.error("Unvolunteer for %s failed: %s", self.date, e)
+            updated = 0
+        success = updated > 0
+        if success:
+            invalidate_available_dates()
+
+        formatted_date = format_date(self.date)
 
         if success:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ **Successfully unvolunteered!**\n"
                 f"📅 You've been removed from: **{formatted_date}**\n"
                 f"💬 Please inform folks on django-news channel so others can pick it up.",
                 ephemeral=True,
             )
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ **Failed to unvolunteer from {formatted_date}**\n"
                 f"Please try again or contact an admin.",
                 ephemeral=True,
@@ -291,7 +364,7 @@ class ConfirmUnvolunteerView(View):
         # Disable buttons
         for item in self.children:
             item.disabled = True
-        await interaction.edit_original_response(view=self)
+        _edit_in_background(interaction.edit_original_response(view=self))
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
     async def cancel_unvolunteer(
@@ -305,4 +378,4 @@ class ConfirmUnvolunteerView(View):
         # Disable buttons
         for item in self.children:
             item.disabled = True
-        await interaction.edit_original_response(view=self)
+        _edit_in_background(interaction.edit_original_response(view=self))
@@ -2,19 +2,77 @@
 Profile modal UI components for volunteer profile management
 """
 
+import logging
+import re
+
 import discord
 from discord import SelectOption
 from discord.ui import Modal, Select, TextInput, View
 
-from utils.timezone import get_popular_timezones, validate_timezone
+from utils.timezone import (
+    POPULAR_TIMEZONE_IDS,
+    get_display_name,
+    get_popular_timezones,
+    validate_timezone,
+)
+
+logger = logging.getLogger(__name__)
+
+# 24-hour HH:MM, e.g. 09:00 or 18:30
+_TIME_RE = re.compile(r"(?:[01][0-9]|2[0-3]):[0-5][0-9]")
+
+_SQL_SET_TIMEZONE = "UPDATE volunteers SET timezone = ? WHERE name = ?"
+
+_SQL_UPDATE_PROFILE = """
+UPDATE volunteers
+SET volunteer_name = ?, social_media_handle = ?,
+    preferred_reminder_time = ?, organization = ?, organization_link = ?
+WHERE name = ?
+"""
+
+_SQL_INSERT_PROFILE = """
+INSERT INTO volunteers (name, reminder_date, due_date, volunteer_name,
+                        social_media_handle, preferred_reminder_time, organization, organization_link, is_taken)
+VALUES (?, '1970-01-01', '1970-01-01', ?, ?, ?, ?, ?, 0)
+"""
+
+_SQL_PROFILE_GET = """
+SELECT timezone, social_media_handle, preferred_reminder_time, volunteer_name, organization, organization_link
+FROM volunteers
+WHERE name = ?
+LIMIT 1
+"""
+
+# Same profile columns plus the active assignment count, in one round trip
+_SQL_PROFILE_WITH_ASSIGNMENTS = """
+SELECT timezone, social_media_handle, preferred_reminder_time, volunteer_name, organization, organization_link,
+       (SELECT COUNT(*) FROM volunteers WHERE name = ? AND is_taken = 1)
+FROM volunteers
+WHERE name = ?
+LIMIT 1
+"""
+
+# Timezone dropdown options, built once at import: popular timezones with
+# room left for the trailing "Other" option
+_TIMEZONE_OPTIONS_WITH_OTHER = [
+    SelectOption(label=display_name, value=tz_id, description=tz_id)
+    for tz_id, display_name in get_popular_timezones()[:24]
+]
+_TIMEZONE_OPTIONS_WITH_OTHER.append(
+    SelectOption(
+        label="Other Timezone",
+        value="__other__",
+        description="Enter a custom timezone",
+        emoji="⚙️",
+    )
+)
 
 
 class ProfileModal(Modal):
     """Modal for editing volunteer profile information"""
 
-    def __init__(self, cursor, user_name: str, current_profile: dict = None):
+    def __init__(self, user_name: str, current_profile: dict = None):
         super().__init__(title="📋 Edit Your Volunteer Profile")
-        self.cursor = cursor
         self.user_name = user_name
         self.current_profile = current_profile or {}
 
@@ -86,9 +144,13 @@ class ProfileModal(Modal):
         organization = self.organization.value.strip()
         organization_link = self.organization_link.value.strip()
 
+        # Acknowledge first so a slow queued write can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         try:
             # Update or create profile (timezone handled separately)
             await self._save_profile(
+                interaction.client.write_queue,
                 volunteer_name,
                 social_handle,
                 reminder_time,
@@ -132,10 +194,10 @@ class ProfileModal(Modal):
                 text="💡 Use !profile to view or edit your profile anytime"
             )
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ **Error saving profile:** {str(e)}\n"
                 "Please try again or contact an admin.",
                 ephemeral=True,
@@ -144,23 +206,11 @@ class ProfileModal(Modal):
     @staticmethod
     def _validate_time_format(time_str: str) -> bool:
         """Validate 24-hour time format (HH:MM)"""
-        try:
-            if ":" not in time_str:
-                return False
-            hours, minutes = time_str.split(":")
-            hour = int(hours)
-            minute = int(minutes)
-            return (
-                0 <= hour <= 23
-                and 0 <= minute <= 59
-                and len(hours) == 2
-                and len(minutes) == 2
-            )
-        except (ValueError, IndexError):
-            return False
+        return _TIME_RE.fullmatch(time_str) is not None
 
     async def _save_profile(
         self,
+        write_queue,
         volunteer_name: str,
         social_handle: str,
         reminder_time: str,
@@ -168,81 +218,35 @@ class ProfileModal(Modal):
         organization_link: str = None,
     ):
         """Save profile to database"""
-        # First check if user has any volunteer entries
-        async with self.cursor.execute(
-            "SELECT id FROM volunteers WHERE name = ? LIMIT 1", (self.user_name,)
-        ) as cursor:
-            user_exists = await cursor.fetchone()
-
-        if user_exists:
-            # Update existing user's profile in all their volunteer entries
-            await self.cursor.execute(
-                """
-                UPDATE volunteers
-                SET volunteer_name = ?, social_media_handle = ?,
-                    preferred_reminder_time = ?, organization = ?, organization_link = ?
-                WHERE name = ?
-                """,
-                (
-                    volunteer_name or None,
-                    social_handle or None,
-                    reminder_time or None,
-                    organization or None,
-                    organization_link or None,
-                    self.user_name,
-                ),
-            )
-        else:
-            # Create a profile entry (this shouldn't happen often, but just in case)
-            await self.cursor.execute(
-                """
-                INSERT INTO volunteers (name, reminder_date, due_date, volunteer_name,
-                                     social_media_handle, preferred_reminder_time, organization, organization_link, is_taken)
-                VALUES (?, '1970-01-01', '1970-01-01', ?, ?, ?, ?, ?, 0)
-                """,
-                (
-                    self.user_name,
-                    volunteer_name or None,
-                    social_handle or None,
-                    reminder_time or None,
-                    organization or None,
-                    organization_link or None,
-                ),
-            )
+        profile = (
+            volunteer_name or None,
+            social_handle or None,
+            reminder_time or None,
+            organization or None,
+            organization_link or None,
+        )
 
-        await self.cursor.commit()
+        # Update the profile on all of the user's volunteer entries; the
+        # rowcount tells us whether the user had any entries at all
+        updated = await write_queue.submit(
+            _SQL_UPDATE_PROFILE, (*profile, self.user_name)
+        )
+
+        if not updated:
+            # Create a profile entry (this shouldn't happen often, but just in case)
+            await write_queue.submit(_SQL_INSERT_PROFILE, (self.user_name, *profile))
 
 
 class TimezoneSelectView(View):
     """View for selecting timezone in profile setup"""
 
-    def __init__(self, cursor, user_name: str):
+    def __init__(self, user_name: str):
         super().__init__(timeout=300)
-        self.cursor = cursor
         self.user_name = user_name
 
-        # Create timezone dropdown using popular timezones
-        timezone_options = get_popular_timezones()
-        options = [
-            SelectOption(label=display_name, value=tz_id, description=tz_id)
-            for tz_id, display_name in timezone_options[
-                :24
-            ]  # Leave room for "Other" option
-        ]
-
-        # Add "Other" option
-        options.append(
-            SelectOption(
-                label="Other Timezone",
-                value="__other__",
-                description="Enter a custom timezone",
-                emoji="⚙️",
-            )
-        )
-
         self.timezone_select = Select(
             placeholder="🌍 Choose your timezone...",
-            options=options,
+            options=list(_TIMEZONE_OPTIONS_WITH_OTHER),
             min_values=1,
             max_values=1,
         )
@@ -255,7 +259,7 @@ class TimezoneSelectView(View):
 
         if selected_timezone == "__other__":
             # Show custom timezone modal
-            modal = CustomTimezoneModal(self.cursor, self.user_name)
+            modal = CustomTimezoneModal(self.user_name)
             await interaction.response.send_modal(modal)
         else:
             # Save the selected timezone
@@ -263,8 +267,8 @@ class TimezoneSelectView(View):
 
     async def _save_timezone(self, interaction: discord.Interaction, timezone: str):
         """Save timezone to database"""
-        # Validate timezone using our utility function
-        if not validate_timezone(timezone):
+        # Dropdown choices are pre-validated; only check anything else
+        if timezone not in POPULAR_TIMEZONE_IDS and not validate_timezone(timezone):
             await interaction.response.send_message(
                 f"❌ **Invalid timezone:** {timezone}\n"
                 "Please select a valid timezone from the list.",
@@ -272,18 +276,20 @@ class TimezoneSelectView(View):
             )
             return
 
+        # Acknowledge first so a slow queued write can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         # Update user's timezone
-        async with self.cursor.execute(
-            "UPDATE volunteers SET timezone = ? WHERE name = ?",
-            (timezone, self.user_name),
-        ) as cursor:
-            await self.cursor.commit()
-            success = cursor.rowcount > 0
+        try:
+            updated = await interaction.client.write_queue.submit(
+                _SQL_SET_TIMEZONE, (timezone, self.user_name)
+            )
+        except Exception as e:
+            logger.error("Timezone update for %s failed: %s", self.user_name, e)
+            updated = 0
+        success = updated > 0
 
         if success:
-            # Get display name for timezone
-            from utils.timezone import get_display_name
-
             display_name = get_display_name(timezone)
 
             embed = discord.Embed(
@@ -295,9 +301,9 @@ class TimezoneSelectView(View):
                 text="💡 This affects your reminder times for volunteer assignments"
             )
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ **Error:** Could not update timezone. Make sure you have volunteer assignments first.\n"
                 "Use `!volunteer` to sign up for dates.",
                 ephemeral=True,
@@ -307,9 +313,8 @@ class TimezoneSelectView(View):
 class CustomTimezoneModal(Modal):
     """Modal for entering custom timezone"""
 
-    def __init__(self, cursor, user_name: str):
+    def __init__(self, user_name: str):
         super().__init__(title="🌍 Enter Custom Timezone")
-        self.cursor = cursor
         self.user_name = user_name
 
         self.timezone_input = TextInput(
@@ -334,13 +339,18 @@ class CustomTimezoneModal(Modal):
             )
             return
 
+        # Acknowledge first so a slow queued write can't expire the interaction
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         # Update user's timezone
-        async with self.cursor.execute(
-            "UPDATE volunteers SET timezone = ? WHERE name = ?",
-            (timezone, self.user_name),
-        ) as cursor:
-            await self.cursor.commit()
-            success = cursor.rowcount > 0
+        try:
+            updated = await interaction.client.write_queue.submit(
+                _SQL_SET_TIMEZONE, (timezone, self.user_name)
+            )
+        except Exception as e:
+            logger.error("Timezone update for %s failed: %s", self.user_name, e)
+            updated = 0
+        success = updated > 0
 
         if success:
             embed = discord.Embed(
@@ -348,9 +358,9 @@ class CustomTimezoneModal(Modal):
                 description=f"Your timezone has been set to **{timezone}**",
                 color=0x0C4B33,
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ **Error:** Could not update timezone. Make sure you have volunteer assignments first.",
                 ephemeral=True,
             )
@@ -359,9 +369,9 @@ class CustomTimezoneModal(Modal):
 class ProfileSetupView(View):
     """Complete profile setup flow with multiple steps"""
 
-    def __init__(self, cursor, user_name: str):
+    def __init__(self, pool, user_name: str):
         super().__init__(timeout=600)  # 10 minute timeout for full setup
-        self.cursor = cursor
+        self.pool = pool
         self.user_name = user_name
 
     @discord.ui.button(
@@ -373,7 +383,7 @@ class ProfileSetupView(View):
         """Open profile editing modal"""
         # Get current profile data
         current_profile = await self._get_current_profile()
-        modal = ProfileModal(self.cursor, self.user_name, current_profile)
+        modal = ProfileModal(self.user_name, current_profile)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(
@@ -383,7 +393,7 @@ class ProfileSetupView(View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Open timezone selection (separate from full profile)"""
-        view = TimezoneSelectView(self.cursor, self.user_name)
+        view = TimezoneSelectView(self.user_name)
 
         embed = discord.Embed(
             title="🌍 Update Your Timezone",
@@ -401,41 +411,50 @@ class ProfileSetupView(View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Show current profile"""
-        profile = await self._get_current_profile()
+        profile = await self._get_profile_and_assignments()
         embed = await self._create_profile_embed(profile)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     async def _get_current_profile(self) -> dict:
         """Get current profile data from database"""
-        async with self.cursor.execute(
-            """
-            SELECT timezone, social_media_handle, preferred_reminder_time, volunteer_name, organization, organization_link
-            FROM volunteers
-            WHERE name = ?
-            LIMIT 1
-            """,
-            (self.user_name,),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-            if row:
-                return {
-                    "timezone": row[0] or "UTC",
-                    "social_media_handle": row[1] or "",
-                    "preferred_reminder_time": row[2] or "09:00",
-                    "volunteer_name": row[3] or "",
-                    "organization": row[4] or "",
-                    "organization_link": row[5] or "",
-                }
-            else:
-                return {
-                    "timezone": "UTC",
-                    "social_media_handle": "",
-                    "preferred_reminder_time": "09:00",
-                    "volunteer_name": "",
-                    "organization": "",
-                    "organization_link": "",
-                }
+        async with self.pool.connection() as conn:
+            rows = await conn.execute_fetchall(_SQL_PROFILE_GET, (self.user_name,))
+        return self._profile_from_row(rows[0] if rows else None)
+
+    async def _get_profile_and_assignments(self) -> dict:
+        """Get profile data and active assignment count in a single query"""
+        async with self.pool.connection() as conn:
+            rows = await conn.execute_fetchall(
+                _SQL_PROFILE_WITH_ASSIGNMENTS, (self.user_name, self.user_name)
+            )
+
+        row = rows[0] if rows else None
+        profile = self._profile_from_row(row)
+        # No volunteer row at all means no assignments either
+        profile["assignment_count"] = row[6] if row else 0
+        return profile
+
+    @staticmethod
+    def _profile_from_row(row) -> dict:
+        """Build a profile dict with defaults from a _SQL_PROFILE_GET row"""
+        if row:
+            return {
+                "timezone": row[0] or "UTC",
+                "social_media_handle": row[1] or "",
+                "preferred_reminder_time": row[2] or "09:00",
+                "volunteer_name": row[3] or "",
+                "organization": row[4] or "",
+                "organization_link": row[5] or "",
+            }
+        else:
+            return {
+                "timezone": "UTC",
+                "social_media_handle": "",
+                "preferred_reminder_time": "09:00",
+                "volunteer_name": "",
+                "organization": "",
+                "organization_link": "",
+            }
 
     async def _create_profile_embed(self, profile: dict) -> discord.Embed:
         """Create an embed showing profile information"""
@@ -445,6 +464,13 @@ class ProfileSetupView(View):
             color=0x0C4B33,
         )
 
+        if "assignment_count" in profile:
+            embed.add_field(
+                name="📅 Active Assignments",
+                value=f"{profile['assignment_count']} volunteer dates",
+                inline=True,
+            )
+
         # Volunteer Name
         embed.add_field(
             name="📝 Volunteer Name",
@@ -455,9 +481,6 @@ class ProfileSetupView(View):
         # Timezone
         timezone_display = profile["timezone"]
         if profile["timezone"] != "UTC":
-            # Try to get a more friendly display name
-            from utils.timezone import get_display_name
-
             timezone_display = get_display_name(profile["timezone"])
 
         embed.add_field(name="🌍 Timezone", value=timezone_display, inline=True)
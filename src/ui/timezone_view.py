@@ -2,34 +2,56 @@
 Simple timezone selection view for basic timezone setting
 """
 
+import logging
+
 from discord import Interaction, SelectOption
 from discord.ui import Select, View
 
-from utils.timezone import get_popular_timezones, validate_timezone
+from utils.timezone import (
+    POPULAR_TIMEZONE_IDS,
+    get_popular_timezones,
+    validate_timezone,
+)
+
+logger = logging.getLogger(__name__)
+
+_SQL_SET_SHIFT_TIMEZONE = """
+UPDATE volunteers
+SET timezone = ?
+WHERE name = ? AND is_taken = 1
+"""
+
+_SQL_SHIFT_TIMEZONES = """
+SELECT timezone FROM volunteers
+WHERE name = ? AND is_taken = 1
+"""
+
+# Popular timezones with improved visual indicators, built once at import
+_TIMEZONE_OPTIONS = [
+    SelectOption(label=display_name, description=tz_id, value=tz_id)
+    for tz_id, display_name in get_popular_timezones()[:25]  # Discord limit
+]
+
+_SUCCESS_MESSAGES = {
+    tz_id: f"Your timezone is set to **{display_name}** "
+    for tz_id, display_name in get_popular_timezones()
+}
 
 
 class TimezoneView(View):
     """Simple timezone selector for !settimezone command"""
 
-    def __init__(self, cursor):
+    def __init__(self):
         super().__init__()
 
-        # Get popular timezones with improved visual indicators
-        timezone_options = get_popular_timezones()
-        dropdown_options = [
-            SelectOption(label=display_name, description=tz_id, value=tz_id)
-            for tz_id, display_name in timezone_options[:25]  # Discord limit
-        ]
-
         self.timezone_select = Select(
             placeholder="Choose your timezone...",
             min_values=1,
             max_values=1,
-            options=dropdown_options,
+            options=list(_TIMEZONE_OPTIONS),
         )
 
         self.timezone_select.callback = self.select_callback
-        self.cursor = cursor
 
         self.add_item(self.timezone_select)
 
@@ -37,8 +59,10 @@ class TimezoneView(View):
         selected_timezone = self.timezone_select.values[0]
         user_name = interaction.user.display_name
 
-        # Validate timezone using our utility function
-        if not validate_timezone(selected_timezone):
+        # Dropdown choices are pre-validated; only check anything else
+        if selected_timezone not in POPULAR_TIMEZONE_IDS and not validate_timezone(
+            selected_timezone
+        ):
             await interaction.response.send_message(
                 f"❌ **Invalid timezone:** {selected_timezone}\n"
                 "Please select a valid timezone from the list.",
@@ -46,24 +70,36 @@ class TimezoneView(View):
             )
             return
 
-        query = """
-            UPDATE volunteers
-            SET timezone = ?
-            WHERE name = ? AND is_taken = 1
-         """
-        async with self.cursor.execute(query, (selected_timezone, user_name)) as cur:
-            await self.cursor.commit()
-            if cur.rowcount > 0:
-                # Get friendly display name
-                from utils.timezone import get_display_name
-
-                display_name = get_display_name(selected_timezone)
-                await interaction.response.send_message(
-                    f"Your timezone is set to **{display_name}** ",
-                    ephemeral=True,
+        # Acknowledge right away so the queued write doesn't hold up the reply
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        async with interaction.client.pool.connection() as conn:
+            rows = await conn.execute_fetchall(_SQL_SHIFT_TIMEZONES, (user_name,))
+
+        # Re-selecting the current timezone needs no write at all
+        if rows and any(timezone != selected_timezone for (timezone,) in rows):
+            try:
+                updated = await interaction.client.write_queue.submit(
+                    _SQL_SET_SHIFT_TIMEZONE, (selected_timezone, user_name)
                 )
-            else:
-                await interaction.response.send_message(
-                    f"Error: {user_name} you don't have any shift yet.",
+            except Exception as e:
+                logger.error("Timezone update for %s failed: %s", user_name, e)
+                await interaction.followup.send(
+                    "❌ **Error:** Could not update your timezone. "
+                    "Please try again or contact an admin.",
                     ephemeral=True,
                 )
+                return
+        else:
+            updated = len(rows)
+
+        if updated > 0:
+            message = _SUCCESS_MESSAGES.get(selected_timezone) or (
+                f"Your timezone is set to **{selected_timezone}** "
+            )
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await interaction.followup.send(
+                f"Error: {user_name} you don't have any shift yet.",
+                ephemeral=True,
+            )
@@ -0,0 +1,54 @@
+"""
+Date formatting utilities for Django News Bot
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from time import monotonic
+
+# strftime pattern; {Do} is the ordinal day ("1st") and {D} the plain day ("1")
+LONG_DATE = "%A, %B {Do} %Y"
+
+# (monotonic expiry, YYYY-MM-DD) for the current UTC day
+_today_cache = (0.0, "")
+
+
+def ordinal(n: int) -> str:
+    """Return n with its English ordinal suffix (1st, 2nd, 11th, ...)"""
+    if 11 <= n % 100 <= 13:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string as stored in the database"""
+    return date.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=4096)
+def format_date(date_str: str, pattern: str = LONG_DATE) -> str:
+    """Format a YYYY-MM-DD string using a strftime pattern"""
+    day = parse_date(date_str)
+    return day.strftime(pattern).format(Do=ordinal(day.day), D=day.day)
+
+
+def days_until(date_str: str, now: datetime) -> int:
+    """Whole days from now until midnight UTC of the given date"""
+    due = datetime.combine(parse_date(date_str), time(), tzinfo=timezone.utc)
+    return (due - now).days
+
+
+def today_iso() -> str:
+    """Current UTC date as YYYY-MM-DD, recomputed only after midnight UTC"""
+    global _today_cache
+    expires_at, value = _today_cache
+    clock = monotonic()
+    if clock >= expires_at:
+        now = datetime.now(timezone.utc)
+        tomorrow = datetime.combine(now.date() + timedelta(days=1), time(), now.tzinfo)
+        value = now.date().isoformat()
+        _today_cache = (clock + (tomorrow - now).total_seconds(), value)
+    return value
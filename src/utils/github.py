@@ -1,104 +1,561 @@
+import asyncio
+import base64
+import http.client
 import json
+import logging
+import os
+import queue
 import subprocess
+import textwrap
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import chain
+from shlex import quote as shlex_quote
 from shlex import split as shlex_split
 
-import arrow
+from utils.dates import format_date
+
+# Aliased pullRequest lookups per GraphQL request; keeps each query well
+# under GitHub's node limits
+PR_DETAILS_BATCH_SIZE = 25
+
+_PR_DETAILS_FIELDS = (
+    "comments(first: 50) { nodes { author { login } body } } "
+    "reviews(first: 50) { nodes { author { login } body } }"
+)
+
+# Merged PR search that also returns each PR's changed file paths, so
+# release-note checks need no per-PR requests
+_MERGED_PRS_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number title url createdAt
+        author { login }
+        files(first: 100) { pageInfo { hasNextPage endCursor } nodes { path } }
+      }
+    }
+  }
+}
+"""
+
+# Follow-up pages of changed files for the rare PR touching over 100 files
+_PR_FILES_QUERY = """
+query($number: Int!, $cursor: String) {
+  repository(owner: "django", name: "django") {
+    pullRequest(number: $number) {
+      files(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path }
+      }
+    }
+  }
+}
+"""
+
+# Aliased per-author issueCount searches per GraphQL request
+AUTHOR_COUNT_BATCH_SIZE = 50
+
+# Concurrent gh invocations; small enough to stay clear of GitHub's
+# secondary (abuse) rate limits
+GH_MAX_WORKERS = 8
+RATE_LIMIT_RETRIES = 3
+
+GITHUB_API_HOST = "api.github.com"
+
+# Gateway errors GitHub returns when a (usually GraphQL) request times out
+# upstream; they succeed on retry
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+logger = logging.getLogger(__name__)
+
+# Idle keep-alive connections to the GitHub API, shared by all threads
+_idle_connections = queue.LifoQueue()
+_token = None
+
+# (ETag, parsed body) of recent GET responses, least recently used first;
+# a matching If-None-Match gets a 304 that costs no rate limit. Cached
+# bodies are shared, so callers must not mutate them
+ETAG_CACHE_SIZE = 256
+_etag_cache = OrderedDict()
+_etag_lock = threading.Lock()
 
 
 def format_date_range_humanized(start, end):
-    start = arrow.get(start, "YYYY-MM-DD")
-    end = arrow.get(end, "YYYY-MM-DD")
-    return f"{start.format('MMMM D')} to {end.format('MMMM D, YYYY')}"
+    return f"{format_date(start, '%B {D}')} to {format_date(end, '%B {D}, %Y')}"
 
 
 def build_github_search_query(start_date, end_date):
     return f"repo:django/django is:pr is:merged merged:{start_date}..{end_date}"
 
 
-def send_command(command):
+def send_command(command, input=None):
     """Execute a GitHub CLI command and return the JSON result"""
     # Split the command string into a list of arguments to avoid shell=True
     command_args = shlex_split(command)
 
-    process = subprocess.Popen(
-        command_args,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=False,  # Explicitly set shell=False for security
-    )
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        # shell=False (the default) keeps the arguments out of a shell
+        process = subprocess.run(
+            command_args,
+            input=input,
+            capture_output=True,
+            encoding="utf-8",
+            check=False,
+        )
 
-    output, error = process.communicate()
+        error_text = process.stderr.strip()
+        if error_text:
+            logger.warning("Command produced error output: %s", error_text)
+            if process.returncode != 0:
+                # Back off and retry when GitHub throttles us
+                if "rate limit" in error_text.lower() and attempt < RATE_LIMIT_RETRIES:
+                    time.sleep(2**attempt)
+                    continue
+                raise Exception(f"Command failed with error: {error_text}")
+
+        return json.loads(process.stdout)
+
+
+def _github_token():
+    """Resolve the API token once, preferring the environment over `gh auth`"""
+    global _token
+    if _token is None:
+        _token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or ""
+        if not _token:
+            try:
+                _token = subprocess.run(
+                    ["gh", "auth", "token"], capture_output=True, text=True, check=True
+                ).stdout.strip()
+            except (OSError, subprocess.CalledProcessError):
+                logger.warning("No GitHub token found, falling back to gh CLI")
+    return _token
+
+
+def _etag_get(path):
+    with _etag_lock:
+        cached = _etag_cache.get(path)
+        if cached:
+            _etag_cache.move_to_end(path)
+        return cached
+
+
+def _etag_put(path, etag, result):
+    with _etag_lock:
+        _etag_cache[path] = (etag, result)
+        _etag_cache.move_to_end(path)
+        if len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+
+
+def _retry_delay(retry_after, attempt):
+    """Seconds to wait before a retry, honouring Retry-After when present"""
+    if retry_after:
+        # Retry-After is either delay-seconds or an HTTP date (RFC 9110)
+        try:
+            return max(0, int(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return 2**attempt
+
+
+def _github_request(method, path, payload=None):
+    """Send a request to the GitHub API over a pooled keep-alive connection"""
+    headers = {
+        "Authorization": f"Bearer {_github_token()}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "djangonews-bot",
+    }
+    body = None
+    if payload is not None:
+        body = json.dumps(payload)
+        headers["Content-Type"] = "application/json"
 
-    if error and error.strip():
-        error_text = error.decode("utf-8")
-        print(f"Warning: Command produced error output: {error_text}")
-        if process.returncode != 0:
-            raise Exception(f"Command failed with error: {error_text}")
+    cached = _etag_get(path) if method == "GET" else None
+    if cached:
+        headers["If-None-Match"] = cached[0]
 
-    return json.loads(output.decode("utf-8"))
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            conn = _idle_connections.get_nowait()
+        except queue.Empty:
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            # The server may have dropped an idle connection; open a new one
+            conn.close()
+            if attempt < RATE_LIMIT_RETRIES:
+                continue
+            raise
+
+        _idle_connections.put(conn)
+
+        # Back off and retry when GitHub throttles us or has a transient error
+        throttled = response.status == 429 or (
+            response.status == 403
+            and (
+                response.getheader("retry-after")
+                or response.getheader("x-ratelimit-remaining") == "0"
+            )
+        )
+        retryable = throttled or response.status in RETRY_STATUSES
+        if retryable and attempt < RATE_LIMIT_RETRIES:
+            time.sleep(_retry_delay(response.getheader("retry-after"), attempt))
+            continue
+
+        if response.status == 304 and cached:
+            return cached[1]
+
+        if response.status >= 400:
+            raise Exception(
+                f"GitHub API {method} {path} failed with {response.status}: "
+                f"{data.decode('utf-8')[:200]}"
+            )
+
+        result = json.loads(data)
+        etag = response.getheader("etag")
+        if method == "GET" and etag:
+            _etag_put(path, etag, result)
+        return result
+
+
+def gh_get(path, **params):
+    """GET a GitHub REST API path and return the parsed JSON"""
+    if params:
+        path = f"{path}?{urllib.parse.urlencode(params)}"
+    if not _github_token():
+        return send_command(f"gh api {shlex_quote(path.lstrip('/'))}")
+    return _github_request("GET", path)
+
+
+def gh_graphql(query, variables=None):
+    """Run a GitHub GraphQL query and return the parsed JSON"""
+    variables = variables or {}
+    if not _github_token():
+        # -F query=@- makes gh read the query document from stdin; -F also
+        # sends non-string variables typed, where -f would send strings
+        fields = "".join(
+            f" {'-f' if isinstance(value, str) else '-F'} "
+            f"{shlex_quote(f'{name}={value}')}"
+            for name, value in variables.items()
+            if value is not None
+        )
+        return send_command(f"gh api graphql -F query=@-{fields}", input=query)
+
+    result = _github_request(
+        "POST", "/graphql", {"query": query, "variables": variables}
+    )
+    if result.get("errors"):
+        # Aliased lookups report unknown PRs/users as errors next to the
+        # data for the rest; only fail when nothing came back
+        if not result.get("data"):
+            raise Exception(f"GraphQL query failed: {result['errors']}")
+        logger.warning("GraphQL query returned errors: %s", result["errors"])
+    return result
 
 
 def fetch_merged_prs(query, limit=200):
-    """Fetch merged PRs using GitHub CLI instead of PyGithub"""
-    command = (
-        "gh pr list --repo django/django "
-        f'-S "{query}" '
-        f"-L {limit} "
-        "--json number,title,url,author,createdAt"
+    """Fetch merged PRs, flagging the ones that touch release notes"""
+    merged_prs = []
+    cursor = None
+    while len(merged_prs) < limit:
+        result = gh_graphql(_MERGED_PRS_QUERY, {"q": query, "cursor": cursor})
+        search = result["data"]["search"]
+
+        for node in search["nodes"]:
+            merged_prs.append(
+                {
+                    "number": node["number"],
+                    "title": node["title"],
+                    "url": node["url"],
+                    # Deleted accounts come back as a null author
+                    "author": node["author"] or {"login": "ghost"},
+                    "createdAt": node["createdAt"],
+                    "modifies_release": _pr_modifies_release_notes(
+                        node["number"], node["files"]
+                    ),
+                }
+            )
+
+        if not search["pageInfo"]["hasNextPage"]:
+            break
+        cursor = search["pageInfo"]["endCursor"]
+    return merged_prs[:limit]
+
+
+def _is_release_note(path):
+    path = path.lower()
+    return path.startswith("docs/releases/") and path.endswith((".txt", ".rst"))
+
+
+def _pr_modifies_release_notes(number, files):
+    """Check a PR's changed files for release notes, paging past the first 100"""
+    while True:
+        if any(_is_release_note(file["path"]) for file in files["nodes"]):
+            return True
+        if not files["pageInfo"]["hasNextPage"]:
+            return False
+
+        try:
+            result = gh_graphql(
+                _PR_FILES_QUERY,
+                {"number": number, "cursor": files["pageInfo"]["endCursor"]},
+            )
+        except Exception as e:
+            logger.warning("Error fetching more files for PR #%s: %s", number, e)
+            return False
+        files = result["data"]["repository"]["pullRequest"]["files"]
+
+
+def fetch_pr_details_batch(pr_numbers):
+    """
+    Fetch comments and reviews for many PRs at once.
+
+    Uses aliased pullRequest lookups in a single GraphQL query per batch
+    instead of a `gh pr view` call per PR.
+
+    Returns:
+        Dict mapping PR number to {"comments", "reviews"} node lists
+    """
+    batches = [
+        pr_numbers[i : i + PR_DETAILS_BATCH_SIZE]
+        for i in range(0, len(pr_numbers), PR_DETAILS_BATCH_SIZE)
+    ]
+
+    details = {}
+    with ThreadPoolExecutor(max_workers=GH_MAX_WORKERS) as executor:
+        for batch_details in executor.map(_fetch_pr_details, batches):
+            details.update(batch_details)
+
+    if pr_numbers:
+        logger.info(
+            "Fetched comments and reviews for %s of %s PRs",
+            len(details),
+            len(pr_numbers),
+        )
+    return details
+
+
+def _fetch_pr_details(batch):
+    """Run one aliased GraphQL query for a batch of PR numbers"""
+    fields = " ".join(
+        f"pr{number}: pullRequest(number: {number}) {{ {_PR_DETAILS_FIELDS} }}"
+        for number in batch
     )
-    return send_command(command)
+    query = f'query {{ repository(owner: "django", name: "django") {{ {fields} }} }}'
+
+    try:
+        result = gh_graphql(query)
+    except Exception as e:
+        logger.warning(
+            "Error fetching details for PRs %s-%s: %s", batch[0], batch[-1], e
+        )
+        return {}
+
+    repository = result["data"]["repository"]
+    details = {}
+    for number in batch:
+        pr = repository.get(f"pr{number}")
+        if pr:
+            details[number] = {key: pr[key]["nodes"] for key in ("comments", "reviews")}
+    return details
+
+
+def fetch_prior_merged_counts(authors, start_date):
+    """
+    Count each author's django/django PRs merged before start_date.
 
+    Uses one aliased `search { issueCount }` per author, batched into a few
+    GraphQL queries, instead of listing every author's PRs.
 
-def get_full_name_contributors(first_timers):
+    Returns:
+        Dict mapping login to merged PR count; failed lookups are left out
+    """
+    counts = {}
+
+    for i in range(0, len(authors), AUTHOR_COUNT_BATCH_SIZE):
+        batch = authors[i : i + AUTHOR_COUNT_BATCH_SIZE]
+        searches = [
+            f"repo:django/django is:pr is:merged author:{login} merged:<{start_date}"
+            for login in batch
+        ]
+        fields = " ".join(
+            f"a{j}: search(query: {json.dumps(search)}, type: ISSUE, first: 1) "
+            "{ issueCount }"
+            for j, search in enumerate(searches)
+        )
+        try:
+            result = gh_graphql(f"query {{ {fields} }}")
+        except Exception as e:
+            logger.warning("Error counting merged PRs for %s: %s", ", ".join(batch), e)
+            continue
+
+        for j, login in enumerate(batch):
+            search = result["data"].get(f"a{j}")
+            if search is not None:
+                counts[login] = search["issueCount"]
+
+    return counts
+
+
+def get_full_name_contributors(first_timers, full_names):
     """
     Update the first_timers list with full names from GitHub when available.
 
     Args:
         first_timers: List of markdown-formatted contributor links
+        full_names: Known {username: full name} entries; names fetched from
+            GitHub are added to it ("" when the user has no name set)
 
     Returns:
         Updated list with full names where available
     """
-    updated_contributors = []
+    # Extract usernames from markdown link format
+    usernames = [
+        contributor.split("](")[0].replace("[", "") for contributor in first_timers
+    ]
+
+    missing = [username for username in usernames if username not in full_names]
+    if missing:
+        full_names.update(_fetch_full_names(missing))
+
+    # Use the name if available, otherwise keep the login link
+    return [
+        f"[{full_names[username]}](https://github.com/{username})"
+        if full_names.get(username)
+        else contributor
+        for username, contributor in zip(usernames, first_timers)
+    ]
+
+
+def _fetch_full_names(usernames):
+    """Fetch GitHub full names for several users with one aliased GraphQL query"""
+    fields = " ".join(
+        f"u{i}: user(login: {json.dumps(username)}) {{ name }}"
+        for i, username in enumerate(usernames)
+    )
+    try:
+        result = gh_graphql(f"query {{ {fields} }}")
+    except Exception as e:
+        # If there's an error, keep the original links
+        logger.warning("Error fetching info for %s: %s", ", ".join(usernames), e)
+        return {}
+
+    full_names = {}
+    for i, username in enumerate(usernames):
+        user_info = result["data"].get(f"u{i}")
+        if user_info is None:
+            logger.warning("Error fetching info for %s: user not found", username)
+            continue
+
+        full_name = (user_info.get("name") or "").strip()
+        if full_name:
+            logger.debug("Found full name for %s: %s", username, full_name)
+        else:
+            logger.debug("No full name found for %s, using login", username)
+        full_names[username] = full_name
 
-    for contributor in first_timers:
-        # Extract username from markdown link format
-        username = contributor.split("](")[0].replace("[", "")
+    logger.info(
+        "Fetched names for %s of %s contributors", len(full_names), len(usernames)
+    )
+    return full_names
 
-        # Fetch user info from GitHub
-        command = f"gh api users/{username}"
-        try:
-            user_info = send_command(command)
-
-            # Use the name if available, otherwise use the login
-            if user_info.get("name") and user_info["name"].strip():
-                full_name = user_info["name"]
-                updated_link = f"[{full_name}](https://github.com/{username})"
-                updated_contributors.append(updated_link)
-                print(f"Found full name for {username}: {full_name}")
-            else:
-                updated_contributors.append(contributor)
-                print(f"No full name found for {username}, using login")
-        except Exception as e:
-            # If there's an error, keep the original link
-            print(f"Error fetching info for {username}: {str(e)}")
-            updated_contributors.append(contributor)
 
-    return updated_contributors
+async def cache_get_many(db_connection, prefix, ids):
+    """Look up cache_entries values for many ids sharing a key prefix"""
+    keys = {f"{prefix}{id_}": id_ for id_ in ids}
+    if not keys:
+        return {}
+
+    placeholders = ",".join("?" * len(keys))
+    rows = await db_connection.execute_fetchall(
+        f"SELECT key, value FROM cache_entries WHERE key IN ({placeholders})",
+        list(keys),
+    )
+    return {keys[key]: value for key, value in rows}
+
+
+async def cache_set_many(db_connection, prefix, values):
+    """Store {id: value} entries in cache_entries under a key prefix"""
+    if not values:
+        return
+
+    await db_connection.executemany(
+        """
+        INSERT OR REPLACE INTO cache_entries (key, value, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        """,
+        [(f"{prefix}{id_}", value) for id_, value in values.items()],
+    )
+    await db_connection.commit()
+
+
+def extract_pr_message(content):
+    """
+    Pull the pr-message value out of Django's new contributor workflow YAML.
+
+    Handles plain scalars and | / > block scalars, which is all the workflow
+    uses; a literal block keeps its line breaks so it matches the bot comment.
+    """
+    lines = content.splitlines()
+
+    for i, line in enumerate(lines):
+        _, found, value = line.partition("pr-message:")
+        if not found:
+            continue
+
+        value = value.strip()
+        if not value.startswith(("|", ">")):  # Single-line
+            return value.strip('"').strip("'")
+
+        # The block runs until the next line indented no deeper than the key
+        key_indent = len(line) - len(line.lstrip())
+        block = []
+        for next_line in lines[i + 1 :]:
+            if (
+                next_line.strip()
+                and len(next_line) - len(next_line.lstrip()) <= key_indent
+            ):
+                break
+            block.append(next_line)
+
+        if value.startswith(">"):  # Folded
+            return " ".join(part.strip() for part in block if part.strip())
+        return textwrap.dedent("\n".join(block)).strip("\n")
+
+    return ""
 
 
 async def get_django_welcome_message(db_connection):
     """Get Django's current new contributor message, with database caching"""
-    cache_key = "django_welcome_message"
+    # Bump the suffix when pr-message parsing changes so stale values refetch
+    cache_key = "django_welcome_message:v2"
 
     # Get current SHA from GitHub first
     try:
-        command = "gh api repos/django/django/contents/.github/workflows/new_contributor_pr.yml"
-        result = send_command(command)
+        result = await asyncio.to_thread(
+            gh_get,
+            "/repos/django/django/contents/.github/workflows/new_contributor_pr.yml",
+        )
         current_sha = result.get("sha", "unknown")
     except Exception as e:
-        print(f"Error getting current SHA: {e}")
+        logger.error("Error getting current SHA: %s", e)
         return ""
 
     # Check database cache and compare SHA
@@ -108,47 +565,24 @@ async def get_django_welcome_message(db_connection):
         ) as cursor:
             cached_row = await cursor.fetchone()
     except Exception as e:
-        print(f"Warning: Could not access cache_entries table: {e}")
+        logger.warning("Could not access cache_entries table: %s", e)
         cached_row = None
 
     if cached_row:
         cached_value, cached_sha = cached_row
         if cached_sha == current_sha and current_sha != "unknown":
-            print(f"Cache up-to-date (SHA: {current_sha[:8]}...)")
+            logger.info("Cache up-to-date (SHA: %s...)", current_sha[:8])
             return cached_value
         else:
-            print(f"SHA changed: {cached_sha[:8]}... → {current_sha[:8]}...")
+            logger.info("SHA changed: %s... → %s...", cached_sha[:8], current_sha[:8])
 
     # Fetch from GitHub (cache missing or SHA changed)
     try:
-        print("Fetching Django workflow...")
+        logger.info("Fetching Django workflow...")
 
         # Decode and find pr-message
-        import base64
-
         content = base64.b64decode(result["content"]).decode("utf-8")
-
-        # Parse pr-message
-        lines = content.split("\n")
-        pr_message = ""
-
-        for i, line in enumerate(lines):
-            if "pr-message:" in line:
-                if "|" in line:  # Multi-line YAML
-                    # Read the actual message content
-                    message_parts = []
-                    for j in range(i + 1, len(lines)):
-                        next_line = lines[j]
-                        if next_line.strip() and not next_line.startswith("  "):
-                            break
-                        if next_line.strip():
-                            message_parts.append(next_line.strip())
-                    pr_message = " ".join(message_parts)
-                else:  # Single-line
-                    pr_message = (
-                        line.split("pr-message:")[1].strip().strip('"').strip("'")
-                    )
-                break
+        pr_message = extract_pr_message(content)
 
         # Save to database cache
         try:
@@ -160,104 +594,101 @@ async def get_django_welcome_message(db_connection):
                 (cache_key, pr_message, current_sha),
             )
             await db_connection.commit()
-            print(f"Cached pr-message to database: {pr_message[:50]}...")
+            logger.info("Cached pr-message to database: %s...", pr_message[:50])
         except Exception as e:
-            print(f"Warning: Could not save to cache_entries table: {e}")
+            logger.warning("Could not save to cache_entries table: %s", e)
         return pr_message
 
     except Exception as e:
-        print(f"Error fetching Django workflow: {e}")
+        logger.error("Error fetching Django workflow: %s", e)
         return ""
 
 
-def identify_first_timers(merged_prs, pr_message):
-    """Identify first-time contributors by checking Django's GitHub Actions bot comments"""
+def identify_first_timers(merged_prs, pr_message, pr_details, statuses):
+    """
+    Identify first-time contributors by checking Django's GitHub Actions bot comments
+
+    Args:
+        merged_prs: PRs returned by fetch_merged_prs
+        pr_message: Django's current welcome message
+        pr_details: Comments and reviews from fetch_pr_details_batch
+        statuses: Known {pr_number: is_first_timer} results; PRs checked
+            against pr_details are added to it
+
+    Returns:
+        List of markdown-formatted contributor links
+    """
     first_timers = []
 
-    print(
+    logger.info(
         "Checking Django's GitHub Actions for first-time contributor determinations..."
     )
-    print(f"Looking for pr-message: {pr_message[:50]}...")
+    logger.info("Looking for pr-message: %s...", pr_message[:50])
 
     for pr in merged_prs:
         pr_number = pr["number"]
         author = pr["author"]["login"]
 
-        print(f"Checking for Django's welcome message on PR #{pr_number} by {author}")
+        if pr_number in statuses:
+            # A merged PR's welcome comment never changes, so reuse the result
+            if statuses[pr_number]:
+                first_timers.append(f"[{author}](https://github.com/{author})")
+            continue
+
+        logger.debug(
+            "Checking for Django's welcome message on PR #%s by %s", pr_number, author
+        )
+
+        result = pr_details.get(pr_number)
+        if result is None:
+            # Fallback: don't include them if we can't verify
+            logger.debug(
+                "No details fetched for PR #%s, skipping %s", pr_number, author
+            )
+            continue
 
         try:
-            # Get all comments/reviews on the PR
-            command = (
-                f"gh pr view {pr_number} --repo django/django --json comments,reviews"
+            # Look for Django's actual pr-message in comments, and in reviews
+            # too since the bot might comment as a review
+            is_first_timer = bool(pr_message) and any(
+                (entry.get("author") or {}).get("login") == "github-actions[bot]"
+                and pr_message in (entry.get("body") or "")
+                for entry in chain(
+                    result.get("comments", []), result.get("reviews", [])
+                )
             )
-            result = send_command(command)
-
-            is_first_timer = False
-
-            # Check comments for GitHub Actions bot
-            for comment in result.get("comments", []):
-                author_login = comment.get("author", {}).get("login", "")
-                body = comment.get("body", "")
-
-                # Look for Django's actual pr-message in comments
-                if (
-                    author_login == "github-actions[bot]"
-                    and pr_message
-                    and pr_message in body
-                ):
-                    is_first_timer = True
-                    print(f"Found Django's welcome message for {author}")
-                    break
-
-            # Also check reviews (the bot might comment as a review)
-            if not is_first_timer:
-                for review in result.get("reviews", []):
-                    author_login = review.get("author", {}).get("login", "")
-                    body = review.get("body", "")
-
-                    if (
-                        author_login == "github-actions[bot]"
-                        and pr_message
-                        and pr_message in body
-                    ):
-                        is_first_timer = True
-                        print(f"Found Django's welcome review for {author}")
-                        break
 
             if is_first_timer:
                 first_timers.append(f"[{author}](https://github.com/{author})")
+                logger.debug("Found Django's welcome message for %s", author)
             else:
-                print(f"No Django welcome message found for {author}")
+                logger.debug("No Django welcome message found for %s", author)
+
+            # Without a pr-message nothing could match, so don't record it
+            if pr_message:
+                statuses[pr_number] = is_first_timer
 
         except Exception as e:
-            print(f"Error checking {author}: {str(e)}")
+            logger.warning("Error checking %s: %s", author, e)
             # Fallback: don't include them if we can't verify
 
+    logger.info(
+        "Found %s first-time contributor(s) in %s PRs",
+        len(first_timers),
+        len(merged_prs),
+    )
     return first_timers
 
 
-def pr_modifies_release_files(pr_number):
-    """Check if a PR modifies release files using GitHub CLI"""
-    command = f"gh pr view {pr_number} --repo django/django --json files"
-    response = send_command(command)
-
-    for file in response["files"]:
-        path = file["path"].lower()
-        if path.startswith("docs/releases/") and (
-            path.endswith(".txt") or path.endswith(".rst")
-        ):
-            return True
-    return False
-
-
-def generate_synopsis(merged_prs, first_timers, search_url):
-    unique_contributors = len({pr["author"]["login"] for pr in merged_prs})
+def generate_synopsis(
+    merged_prs, unique_contributors, first_timers, search_url, full_names
+):
     synopsis = (
         f"Last week we had [{len(merged_prs)} pull requests]({search_url}) merged into Django by "
         f"{unique_contributors} different contributors"
     )
     if first_timers:
-        contributors_with_names = get_full_name_contributors(first_timers)
+        contributors_with_names = get_full_name_contributors(first_timers, full_names)
 
         # Format the contributors list with "and" before the last item
         if len(contributors_with_names) == 1:
@@ -301,7 +732,8 @@ async def save_weekly_report_to_db(db_connection, start_date, end_date, report_d
             report_data["first_time_contributors_count"],
             report_data["synopsis"],
             report_data["date_range_humanized"],
-            json.dumps(report_data["prs"]),
+            # Only ever read back by json.loads, so skip the padding spaces
+            json.dumps(report_data["prs"], separators=(",", ":")),
         ),
     )
 
@@ -318,12 +750,12 @@ async def save_weekly_report_to_db(db_connection, start_date, end_date, report_d
     )
 
     await db_connection.commit()
-    print(f"📊 Saved weekly report to database: {start_date} to {end_date}")
+    logger.info("📊 Saved weekly report to database: %s to %s", start_date, end_date)
 
     # Check how many reports we have now
     async with db_connection.execute("SELECT COUNT(*) FROM weekly_reports") as cursor:
         count = (await cursor.fetchone())[0]
-        print(f"📈 Database now contains {count} weekly report(s)")
+        logger.info("📈 Database now contains %s weekly report(s)", count)
 
 
 async def fetch_django_pr_summary(db_connection, start_date, end_date):
@@ -336,34 +768,113 @@ async def fetch_django_pr_summary(db_connection, start_date, end_date):
     encoded_query = urllib.parse.quote_plus(query)
     search_url = f"https://github.com/search?q={encoded_query}"
 
-    print(f"Fetching PRs merged from {start_date} to {end_date}...")
+    logger.info("Fetching PRs merged from %s to %s...", start_date, end_date)
 
     # Get Django welcome message for first-timer detection
     pr_message = await get_django_welcome_message(db_connection)
 
-    merged_prs = fetch_merged_prs(query)
-
-    first_timers = identify_first_timers(merged_prs, pr_message)
-
-    synopsis = generate_synopsis(
-        merged_prs,
-        first_timers,
-        search_url,
-    )
+    # The GitHub calls block, so keep them off the event loop
+    merged_prs = await asyncio.to_thread(fetch_merged_prs, query)
 
+    # Collect everything the later steps need from the PR list in one pass
     pr_data = []
+    pr_numbers = []
+    authors = {}  # Insertion-ordered set of logins
     for pr in merged_prs:
-        modifies_release = pr_modifies_release_files(pr["number"])
+        author = pr["author"]["login"]
+        pr_numbers.append(pr["number"])
+        authors[author] = None
         pr_data.append(
             {
                 "number": pr["number"],
                 "title": pr["title"],
-                "author": pr["author"]["login"],
+                "author": author,
                 "url": pr["url"],
-                "modifies_release": modifies_release,
+                "modifies_release": pr["modifies_release"],
             }
         )
 
+    # Authors seen in an earlier week's summary already had a PR merged, so
+    # they can't be first-timers; the value is the first week they were seen
+    first_seen = await cache_get_many(db_connection, "author:", list(authors))
+    returning_authors = {
+        author for author, week in first_seen.items() if week < start_date
+    }
+
+    if pr_message:
+        # Merged PRs don't change, so reuse earlier first-timer results and
+        # only fetch comments for PRs we haven't seen
+        cached_first_timers = await cache_get_many(
+            db_connection, "firsttimer:", pr_numbers
+        )
+        first_timer_statuses = {
+            number: value == "1" for number, value in cached_first_timers.items()
+        }
+        for pr in merged_prs:
+            if pr["author"]["login"] in returning_authors:
+                first_timer_statuses.setdefault(pr["number"], False)
+
+        uncached = [
+            number for number in pr_numbers if number not in first_timer_statuses
+        ]
+        pr_details = await asyncio.to_thread(fetch_pr_details_batch, uncached)
+
+        first_timers = identify_first_timers(
+            merged_prs, pr_message, pr_details, first_timer_statuses
+        )
+
+        await cache_set_many(
+            db_connection,
+            "firsttimer:",
+            {
+                number: "1" if is_first_timer else "0"
+                for number, is_first_timer in first_timer_statuses.items()
+                if number not in cached_first_timers
+            },
+        )
+    else:
+        # Without the welcome message, fall back to merge history: authors
+        # with no PRs merged before this week are first-timers
+        logger.info("No pr-message available, checking contributors' merge history")
+        prior_counts = await asyncio.to_thread(
+            fetch_prior_merged_counts,
+            [author for author in authors if author not in returning_authors],
+            start_date,
+        )
+        first_timers = [
+            f"[{author}](https://github.com/{author})"
+            for author in authors
+            if prior_counts.get(author) == 0
+        ]
+
+    usernames = [link.split("](")[0].replace("[", "") for link in first_timers]
+    full_names = await cache_get_many(db_connection, "user:", usernames)
+    cached_users = set(full_names)
+
+    synopsis = await asyncio.to_thread(
+        generate_synopsis,
+        merged_prs,
+        len(authors),
+        first_timers,
+        search_url,
+        full_names,
+    )
+
+    await cache_set_many(
+        db_connection,
+        "author:",
+        {author: start_date for author in authors if author not in first_seen},
+    )
+    await cache_set_many(
+        db_connection,
+        "user:",
+        {
+            username: full_name
+            for username, full_name in full_names.items()
+            if username not in cached_users
+        },
+    )
+
     summary_data = {
         "synopsis": synopsis,
         "total_prs": len(merged_prs),
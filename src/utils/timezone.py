@@ -3,42 +3,46 @@ Simple timezone utilities for Django News Bot
 """
 
 import zoneinfo
-from typing import List, Tuple
+from functools import lru_cache
 
+# Curated popular timezones with friendlier display names
+_POPULAR_TZ: dict[str, str] = {
+    # Americas
+    "America/New_York": "🏙️ New York (Eastern)",
+    "America/Chicago": "🌆 Chicago (Central)",
+    "America/Denver": "⛰️ Denver (Mountain)",
+    "America/Los_Angeles": "🌴 Los Angeles (Pacific)",
+    "America/Toronto": "🍁 Toronto",
+    "America/Vancouver": "🍁 Vancouver",
+    "America/Mexico_City": "🇲🇽 Mexico City",
+    "America/Sao_Paulo": "🇧🇷 São Paulo",
+    # Europe
+    "Europe/London": "🇬🇧 London",
+    "Europe/Paris": "🇫🇷 Paris",
+    "Europe/Berlin": "🇩🇪 Berlin",
+    "Europe/Rome": "🇮🇹 Rome",
+    "Europe/Madrid": "🇪🇸 Madrid",
+    "Europe/Amsterdam": "🇳🇱 Amsterdam",
+    # Asia
+    "Asia/Tokyo": "🇯🇵 Tokyo",
+    "Asia/Seoul": "🇰🇷 Seoul",
+    "Asia/Shanghai": "🇨🇳 Shanghai",
+    "Asia/Kolkata": "🇮🇳 Mumbai/Delhi",
+    "Asia/Dubai": "🇦🇪 Dubai",
+    "Asia/Singapore": "🇸🇬 Singapore",
+    # Oceania
+    "Australia/Sydney": "🇦🇺 Sydney",
+    "Australia/Melbourne": "🇦🇺 Melbourne",
+    "Pacific/Auckland": "🇳🇿 Auckland",
+}
 
-def get_popular_timezones() -> List[Tuple[str, str]]:
+
+def get_popular_timezones() -> list[tuple[str, str]]:
     """Get a curated list of popular timezones with better visual indicators"""
-    return [
-        # Americas
-        ("America/New_York", "🏙️ New York (Eastern)"),
-        ("America/Chicago", "🌆 Chicago (Central)"),
-        ("America/Denver", "⛰️ Denver (Mountain)"),
-        ("America/Los_Angeles", "🌴 Los Angeles (Pacific)"),
-        ("America/Toronto", "🍁 Toronto"),
-        ("America/Vancouver", "🍁 Vancouver"),
-        ("America/Mexico_City", "🇲🇽 Mexico City"),
-        ("America/Sao_Paulo", "🇧🇷 São Paulo"),
-        # Europe
-        ("Europe/London", "🇬🇧 London"),
-        ("Europe/Paris", "🇫🇷 Paris"),
-        ("Europe/Berlin", "🇩🇪 Berlin"),
-        ("Europe/Rome", "🇮🇹 Rome"),
-        ("Europe/Madrid", "🇪🇸 Madrid"),
-        ("Europe/Amsterdam", "🇳🇱 Amsterdam"),
-        # Asia
-        ("Asia/Tokyo", "🇯🇵 Tokyo"),
-        ("Asia/Seoul", "🇰🇷 Seoul"),
-        ("Asia/Shanghai", "🇨🇳 Shanghai"),
-        ("Asia/Kolkata", "🇮🇳 Mumbai/Delhi"),
-        ("Asia/Dubai", "🇦🇪 Dubai"),
-        ("Asia/Singapore", "🇸🇬 Singapore"),
-        # Oceania
-        ("Australia/Sydney", "🇦🇺 Sydney"),
-        ("Australia/Melbourne", "🇦🇺 Melbourne"),
-        ("Pacific/Auckland", "🇳🇿 Auckland"),
-    ]
+    return list(_POPULAR_TZ.items())
 
 
+@lru_cache(maxsize=1024)
 def validate_timezone(timezone: str) -> bool:
     """Validate if a timezone string is valid"""
     try:
@@ -50,5 +54,8 @@ def validate_timezone(timezone: str) -> bool:
 
 def get_display_name(timezone: str) -> str:
     """Get friendly display name for a timezone"""
-    popular_tz = dict(get_popular_timezones())
-    return popular_tz.get(timezone, timezone)
+    return _POPULAR_TZ.get(timezone, timezone)
+
+
+# Timezone IDs offered in the dropdowns; all are known to be valid
+POPULAR_TIMEZONE_IDS = frozenset(_POPULAR_TZ)